@@ -19,6 +19,7 @@ from typing import Any
 from playwright.sync_api import sync_playwright
 
 from llm import ToolCallingAgent, Tool
+from daemon.profiles.base import load_prompt
 
 from ddgs import DDGS
 
@@ -449,39 +450,8 @@ ALL_TOOLS = [
 
 # --- System Prompt ---
 
-SYSTEM_PROMPT = """You are a code runner agent. Your task is to run code in online playgrounds.
-
-## Your Capabilities
-- You can search the web to find online code playgrounds
-- You can control a browser to navigate, click, and type
-- You can write code in any programming language
-
-## Finding Playgrounds
-You do NOT have hardcoded playground URLs. You MUST use web_search to find an online interpreter for the requested language.
-Search for: "[language] online interpreter run code"
-
-## Workflow
-1. web_search for "[language] online interpreter run code"
-2. browser_navigate to best result (NOT documentation/GitHub)
-3. browser_analyze_page to check readiness
-4. If ready_for_code is TRUE:
-   a. browser_paste_code with your complete code
-   b. browser_click using EXACT selector from run_button_selectors (e.g. "button:has-text('Run')")
-   c. browser_wait for 2 seconds
-   d. browser_get_text to see output
-5. If NOT ready: try another URL
-
-CRITICAL: Use the EXACT selectors returned by browser_analyze_page! Do not guess.
-
-## IMPORTANT WARNINGS
-- A playground MUST have: (1) code input area, (2) Run/Execute button, (3) output area
-- Documentation sites, wikis, and GitHub repos are NOT playgrounds!
-- If the first site doesn't work, search again with different terms
-- Write COMPLETE, working code - not pseudocode
-- Always include necessary imports/includes
-- Make sure the code is syntactically correct
-- After running, tell the user what output you observed
-- Do NOT close the browser - leave it open for the user"""
+# Shared with the daemon's code_runner profile
+SYSTEM_PROMPT = load_prompt("code_runner")
 
 
 # --- Main Entry Point ---
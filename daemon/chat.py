@@ -13,18 +13,28 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Protocol, Sequence, TypeVar
 
-from .tools import Tool, ToolSpec, get_registry, ToolRegistry
+import orjson
+
+from .tools import ToolSpec, get_registry, ToolRegistry
 from .profiles import Profile, get_profile, ALL_PROFILES
 
+logger = logging.getLogger("qwen.chat")
+
+T = TypeVar("T")
+
 
 # --- Message Types ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     """Immutable chat message."""
 
@@ -32,7 +42,17 @@ class ChatMessage:
     content: str
 
 
-@dataclass(frozen=True)
+class ConversationMessage(Protocol):
+    """Anything with a role and content, e.g. ChatMessage or a stored SessionMessage."""
+
+    @property
+    def role(self) -> str: ...
+
+    @property
+    def content(self) -> str: ...
+
+
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     """Parsed tool call from LLM response."""
 
@@ -40,7 +60,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     """Result from tool execution."""
 
@@ -48,7 +68,7 @@ class ToolResult:
     result: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatResponse:
     """Complete response from chat service."""
 
@@ -62,61 +82,51 @@ class ChatResponse:
 # --- Prompt Formatting (Pure Functions) ---
 
 
-def format_tools_prompt(tools: tuple[Tool, ...]) -> str:
-    """Format tool specs into system prompt section."""
-    if not tools:
-        return ""
-
-    schemas = [tool.to_schema() for tool in tools]
-    tools_json = "\n".join(json.dumps(s) for s in schemas)
-
-    return f"""
-
-# Tools
-
-You may call one or more functions to assist with the user query.
-
-You are provided with function signatures within <tools></tools> XML tags:
-<tools>
-{tools_json}
-</tools>
-
-For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:
-<tool_call>
-{{"name": "<function-name>", "arguments": {{"<arg1>": "<value1>"}}}}
-</tool_call>"""
-
-
 def build_system_prompt(profile: Profile) -> str:
     """Build complete system prompt from profile and tools."""
-    return profile.system_prompt + format_tools_prompt(profile.tools)
+    return profile.rendered_system_prompt
+
+
+_TOOL_CALL_RE = re.compile(r"<tool_call>\s*({.*?})\s*</tool_call>", re.DOTALL)
 
 
 def parse_tool_calls(response: str) -> list[ToolCall]:
     """Extract tool calls from LLM response."""
-    pattern = r"<tool_call>\s*({.*?})\s*</tool_call>"
-    matches: list[str] = re.findall(pattern, response, re.DOTALL)
-
     calls: list[ToolCall] = []
-    for match in matches:
+    for match in _TOOL_CALL_RE.finditer(response):
         try:
-            data: dict[str, Any] = json.loads(match)
+            data: dict[str, Any] = orjson.loads(match.group(1))
             name: str = data.get("name", "")
+            if isinstance(name, str):
+                # Tool names are interned, so registry and profile lookups
+                # on the parsed name match on identity
+                name = sys.intern(name)
             arguments: dict[str, Any] = data.get("arguments", {})
             calls.append(ToolCall(name=name, arguments=arguments))
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             continue
 
     return calls
 
 
-def extract_final_response(response: str) -> str:
-    """Extract text response, removing tool call and thinking artifacts."""
+_TOOL_BLOCK_RE = re.compile(r"<tool_call>.*?</tool_call>", re.DOTALL)
+_THINK_BLOCK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
+def _clean_response(response: str) -> tuple[str, bool]:
+    """Strip tool call and thinking blocks; also report whether thinking was present."""
     # Remove tool call blocks
-    cleaned = re.sub(r"<tool_call>.*?</tool_call>", "", response, flags=re.DOTALL)
+    cleaned = _TOOL_BLOCK_RE.sub("", response)
     # Remove thinking blocks (Qwen3 hybrid reasoning)
-    cleaned = re.sub(r"<think>.*?</think>", "", cleaned, flags=re.DOTALL)
-    return cleaned.strip()
+    cleaned = _THINK_BLOCK_RE.sub("", cleaned)
+    # Any <think> counts, including one left unclosed when generation hit
+    # max_tokens mid-thought; that is the case the nudge exists for
+    return cleaned.strip(), "<think>" in response
+
+
+def extract_final_response(response: str) -> str:
+    """Extract text response, removing tool call and thinking artifacts."""
+    return _clean_response(response)[0]
 
 
 def format_tool_results(results: list[ToolResult]) -> str:
@@ -127,10 +137,23 @@ def format_tool_results(results: list[ToolResult]) -> str:
     )
 
 
+def _unavailable_tool_result(name: str, profile: Profile) -> str:
+    """Error result for a tool call outside the profile's tool set."""
+    return json.dumps(
+        {"error": f"Tool {name} is not available in profile {profile.name}"}
+    )
+
+
 def extract_thinking(response: str) -> str | None:
     """Extract thinking content from LLM response."""
-    match = re.search(r"<think>(.*?)</think>", response, re.DOTALL)
-    return match.group(1).strip() if match else None
+    start = response.find("<think>")
+    if start < 0:
+        return None
+    start += len("<think>")
+    end = response.find("</think>", start)
+    if end < 0:
+        return None
+    return response[start:end].strip()
 
 
 # --- Model Size Enum ---
@@ -145,6 +168,7 @@ class ModelSize(Enum):
     SMALL = "mlx-community/Qwen2.5-7B-Instruct-4bit"  # ~5GB
     MEDIUM = "mlx-community/Qwen2.5-14B-Instruct-4bit"  # ~10GB
     LARGE = "mlx-community/Qwen3-32B-4bit"  # ~18GB
+    LARGE_3BIT = "mlx-community/Qwen3-32B-3bit"  # ~14GB, fewer bytes per decoded token
 
 
 # --- Qwen Model Singleton ---
@@ -154,20 +178,31 @@ class QwenModel:
     """
     Singleton wrapper around MLX-LM Qwen model.
 
-    Loads model lazily on first inference request.
+    Loads model lazily on first inference request. Async generation runs on a
+    single dedicated worker thread shared by all instances, so MLX work is
+    serialized on one thread instead of hopping across the default pool.
     """
 
     _instance: QwenModel | None = None
+    _generation_executor: ThreadPoolExecutor | None = None
 
     def __init__(self, model_size: ModelSize = ModelSize.LARGE) -> None:
         self._model_size = model_size
+        # Resolved once; Enum .value goes through descriptor machinery
+        self._model_id: str = model_size.value
         self._model: Any = None
         self._tokenizer: Any = None
+        # KV cache of the previous prompt, reused for its shared token prefix
+        self._prompt_cache: list[Any] | None = None
+        self._cached_tokens: list[int] = []
+        self._cache_lock = threading.Lock()
+        # Rendered system block -> its token IDs, keyed by system prompt
+        self._system_tokens: dict[str, tuple[str, list[int]]] = {}
 
     @classmethod
     def get_instance(cls, model_size: ModelSize = ModelSize.LARGE) -> QwenModel:
         """Get or create singleton instance."""
-        if cls._instance is None or cls._instance._model_size != model_size:
+        if cls._instance is None or cls._instance._model_size is not model_size:
             cls._instance = cls(model_size)
         return cls._instance
 
@@ -176,39 +211,156 @@ class QwenModel:
         if self._model is None or self._tokenizer is None:
             from mlx_lm import load
 
-            print(f"Loading {self._model_size.value}...")
-            result = load(self._model_size.value)
+            logger.info("Loading %s...", self._model_id)
+            result = load(self._model_id)
             self._model = result[0]
             self._tokenizer = result[1]
-            print("Model loaded.")
+            logger.info("Model loaded.")
         return self._model, self._tokenizer
 
+    def _tokenize(self, tokenizer: Any, messages: list[dict[str, str]]) -> list[int]:
+        """
+        Render and tokenize the chat prompt.
+
+        System prompts are profile constants, so the tokens of the rendered
+        system block are computed once per prompt and only the rest of the
+        conversation is encoded on each call.
+        """
+        prompt: str = tokenizer.apply_chat_template(
+            messages,
+            tokenize=False,
+            add_generation_prompt=True,
+        )
+        if not messages or messages[0]["role"] != "system":
+            return tokenizer.encode(prompt, add_special_tokens=False)
+
+        system_prompt = messages[0]["content"]
+        cached = self._system_tokens.get(system_prompt)
+        if cached is None:
+            prefix: str = tokenizer.apply_chat_template(
+                messages[:1], tokenize=False
+            )
+            cached = (prefix, tokenizer.encode(prefix, add_special_tokens=False))
+            self._system_tokens[system_prompt] = cached
+
+        prefix, prefix_tokens = cached
+        if not prompt.startswith(prefix):
+            return tokenizer.encode(prompt, add_special_tokens=False)
+        rest = tokenizer.encode(prompt[len(prefix) :], add_special_tokens=False)
+        return prefix_tokens + rest
+
+    def _reuse_prompt_cache(
+        self, model: Any, tokens: list[int]
+    ) -> tuple[list[Any], int]:
+        """
+        Prepare the prompt cache for a new prompt.
+
+        Keeps the KV entries for the longest token prefix shared with the
+        previous prompt (system prompt, tool schemas, earlier turns) and
+        returns the cache together with the number of reused tokens.
+        """
+        from mlx_lm.models.cache import (
+            can_trim_prompt_cache,
+            make_prompt_cache,
+            trim_prompt_cache,
+        )
+
+        cache = self._prompt_cache
+        cached = self._cached_tokens
+        common = 0
+        for old, new in zip(cached, tokens):
+            if old != new:
+                break
+            common += 1
+        # At least one token must be fed to produce the next-token logits
+        common = min(common, len(tokens) - 1)
+
+        if cache is None or common <= 0 or not can_trim_prompt_cache(cache):
+            return make_prompt_cache(model), 0
+        trim_prompt_cache(cache, len(cached) - common)
+        return cache, common
+
     def generate(
         self,
         messages: list[dict[str, str]],
         max_tokens: int = 4096,
     ) -> str:
-        """Generate response from messages."""
+        """
+        Generate response from messages.
+
+        The KV cache of the previous prompt is reused for the token prefix
+        both prompts share, so the static system prompt and earlier turns
+        are only prefilled once per conversation.
+        """
         model, tokenizer = self._ensure_loaded()
 
-        prompt: str = tokenizer.apply_chat_template(
-            messages,
-            tokenize=False,
-            add_generation_prompt=True,
-        )
+        tokens = self._tokenize(tokenizer, messages)
 
         import mlx_lm
+        from mlx_lm.models.cache import trim_prompt_cache
 
         generate_fn = getattr(mlx_lm, "generate")
-        response: str = generate_fn(
-            model,
-            tokenizer,
-            prompt=prompt,
-            max_tokens=max_tokens,
-            verbose=False,
-        )
+        with self._cache_lock:
+            cache, reused = self._reuse_prompt_cache(model, tokens)
+            # Drop the cache while generating so a failure cannot leave it
+            # out of sync with _cached_tokens
+            self._prompt_cache = None
+            self._cached_tokens = []
+            logger.debug("Reusing %d/%d prompt tokens", reused, len(tokens))
+
+            response: str = generate_fn(
+                model,
+                tokenizer,
+                prompt=tokens[reused:],
+                max_tokens=max_tokens,
+                verbose=False,
+                prompt_cache=cache,
+            )
+
+            # Generated tokens are not part of the next prompt verbatim
+            # (the template re-renders them), so keep only the prompt.
+            trim_prompt_cache(cache, cache[0].offset - len(tokens))
+            self._prompt_cache = cache
+            self._cached_tokens = tokens
         return response
 
+    @classmethod
+    def _get_generation_executor(cls) -> ThreadPoolExecutor:
+        """Get or create the shared single-thread generation executor."""
+        if cls._generation_executor is None:
+            cls._generation_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="qwen-generate"
+            )
+        return cls._generation_executor
+
+    async def _run_on_generation_thread(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func on the generation thread, finishing it even if cancelled.
+
+        MLX calls can't be interrupted, so cancelling the awaiting task does
+        not stop the worker. Wait for it before re-raising, so a caller that
+        holds the generation lock keeps it until the thread is actually idle.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_generation_executor(), func, *args)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait((future,))
+            raise
+
+    async def generate_async(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int = 4096,
+    ) -> str:
+        """Generate response on the dedicated generation thread."""
+        return await self._run_on_generation_thread(self.generate, messages, max_tokens)
+
+    async def load_async(self) -> None:
+        """Load model and tokenizer on the dedicated generation thread."""
+        await self._run_on_generation_thread(self._ensure_loaded)
+
     @property
     def is_loaded(self) -> bool:
         """Check if model is currently loaded."""
@@ -236,11 +388,20 @@ class ChatService:
         self._model = model
         self._registry = registry
 
+    async def load_async(self) -> None:
+        """Load the model's weights without blocking the event loop."""
+        await self._model.load_async()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model's weights are resident."""
+        return self._model.is_loaded
+
     def chat(
         self,
         user_message: str,
         profile_name: str = "general",
-        conversation_history: list[ChatMessage] | None = None,
+        conversation_history: Sequence[ConversationMessage] | None = None,
         verbose: bool = False,
     ) -> ChatResponse:
         """
@@ -257,42 +418,45 @@ class ChatService:
             )
 
         system_prompt = build_system_prompt(profile)
+        max_rounds = profile.max_tool_rounds
+        max_tokens = profile.max_tokens
+        has_tools = bool(profile.tools)
+        verbose = verbose and logger.isEnabledFor(logging.INFO)
 
-        conversation: list[ChatMessage] = list(conversation_history or [])
-        conversation.append(ChatMessage("user", user_message))
+        # Model input is built once and extended in place as rounds progress
+        messages = self._build_messages(system_prompt, conversation_history or [])
+        messages.append({"role": "user", "content": user_message})
 
         all_tool_calls: list[ToolCall] = []
         all_tool_results: list[ToolResult] = []
         response: str = ""
 
-        for round_num in range(profile.max_tool_rounds):
-            messages = self._build_messages(system_prompt, conversation)
-
+        for round_num in range(max_rounds):
             if verbose:
-                print(f"\n⏳ Round {round_num + 1} - Generating...")
+                logger.info("⏳ Round %d - Generating...", round_num + 1)
 
-            response = self._model.generate(messages, max_tokens=profile.max_tokens)
+            response = self._model.generate(messages, max_tokens=max_tokens)
 
             if verbose:
                 preview = response[:500] + "..." if len(response) > 500 else response
-                print(f"✅ Round {round_num + 1} - Response:\n{'-' * 40}\n{preview}\n{'-' * 40}")
+                logger.info("✅ Round %d - Response:\n%s", round_num + 1, preview)
 
             tool_calls = parse_tool_calls(response)
 
             if not tool_calls:
-                final_content = extract_final_response(response)
+                final_content, had_thinking = _clean_response(response)
 
                 if (
-                    "<think>" in response
+                    had_thinking
                     and len(final_content) < 50
                     and round_num < 3
-                    and profile.tools
+                    and has_tools
                 ):
                     if verbose:
-                        print("🔄 Model thinking without acting, nudging...")
-                    conversation.append(ChatMessage("assistant", response))
-                    conversation.append(
-                        ChatMessage("user", "Now use your tools to help answer the question.")
+                        logger.info("🔄 Model thinking without acting, nudging...")
+                    messages.append({"role": "assistant", "content": response})
+                    messages.append(
+                        {"role": "user", "content": "Now use your tools to help answer the question."}
                     )
                     continue
 
@@ -305,57 +469,58 @@ class ChatService:
                 )
 
             if verbose:
-                print(f"🔧 Found {len(tool_calls)} tool call(s):")
+                logger.info("🔧 Found %d tool call(s):", len(tool_calls))
                 for tc in tool_calls:
-                    print(f"   - {tc.name}({tc.arguments})")
+                    logger.info("   - %s(%s)", tc.name, tc.arguments)
 
             round_results: list[ToolResult] = []
             for tc in tool_calls:
-                result = self._registry.execute(tc.name, tc.arguments)
+                if tc.name in profile.tool_names_set:
+                    result = self._registry.execute(tc.name, tc.arguments)
+                else:
+                    result = _unavailable_tool_result(tc.name, profile)
                 round_results.append(ToolResult(tc.name, result))
                 all_tool_calls.append(tc)
                 all_tool_results.append(round_results[-1])
 
             if verbose:
-                print("📦 Tool results:")
+                logger.info("📦 Tool results:")
                 for tr in round_results:
-                    preview = tr.result[:200]
-                    print(f"   - {tr.tool_name}: {preview}")
+                    logger.info("   - %s: %s", tr.tool_name, tr.result[:200])
 
-            conversation.append(ChatMessage("assistant", response))
-            conversation.append(ChatMessage("user", format_tool_results(round_results)))
+            messages.append({"role": "assistant", "content": response})
+            messages.append({"role": "user", "content": format_tool_results(round_results)})
 
         return ChatResponse(
             content=extract_final_response(response),
             tool_calls=tuple(all_tool_calls),
             tool_results=tuple(all_tool_results),
-            rounds_used=profile.max_tool_rounds,
+            rounds_used=max_rounds,
             finished=False,
         )
 
     def _build_messages(
         self,
         system_prompt: str,
-        conversation: list[ChatMessage],
+        conversation: Sequence[ConversationMessage],
     ) -> list[dict[str, str]]:
         """Convert conversation to model input format."""
         messages = [{"role": "system", "content": system_prompt}]
-        for msg in conversation:
-            messages.append({"role": msg.role, "content": msg.content})
+        messages.extend({"role": msg.role, "content": msg.content} for msg in conversation)
         return messages
 
     async def chat_async(
         self,
         user_message: str,
         profile_name: str = "general",
-        conversation_history: list[ChatMessage] | None = None,
+        conversation_history: Sequence[ConversationMessage] | None = None,
         verbose: bool = False,
         on_event: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
     ) -> ChatResponse:
         """
         Process a chat message with the specified agent profile (async version).
 
-        Supports async tools and runs model generation in a thread pool.
+        Supports async tools and runs model generation on the dedicated generation thread.
         """
         profile = get_profile(profile_name)
         if profile is None:
@@ -369,69 +534,61 @@ class ChatService:
 
         system_prompt = build_system_prompt(profile)
         max_rounds = profile.max_tool_rounds
+        max_tokens = profile.max_tokens
+        has_tools = bool(profile.tools)
+        verbose = verbose and logger.isEnabledFor(logging.INFO)
 
-        async def emit(event: dict[str, Any]) -> None:
-            if on_event is not None:
-                await on_event(event)
-
-        conversation: list[ChatMessage] = list(conversation_history or [])
-        conversation.append(ChatMessage("user", user_message))
+        # Model input is built once and extended in place as rounds progress
+        messages = self._build_messages(system_prompt, conversation_history or [])
+        messages.append({"role": "user", "content": user_message})
 
         all_tool_calls: list[ToolCall] = []
         all_tool_results: list[ToolResult] = []
         response: str = ""
 
         for round_num in range(max_rounds):
-            await emit({
-                "type": "round_start",
-                "round": round_num + 1,
-                "max_rounds": max_rounds,
-            })
-
-            messages = self._build_messages(system_prompt, conversation)
+            # Shared per-round fields; events are only built when someone listens
+            round_info: dict[str, Any] = {"round": round_num + 1, "max_rounds": max_rounds}
+            if on_event is not None:
+                await on_event({"type": "round_start", **round_info})
 
             if verbose:
-                print(f"\n⏳ Round {round_num + 1} - Generating...")
+                logger.info("⏳ Round %d - Generating...", round_num + 1)
 
-            await emit({
-                "type": "generating",
-                "round": round_num + 1,
-                "max_rounds": max_rounds,
-            })
+            if on_event is not None:
+                await on_event({"type": "generating", **round_info})
 
-            response = await asyncio.to_thread(
-                self._model.generate, messages, profile.max_tokens
-            )
+            response = await self._model.generate_async(messages, max_tokens)
 
             if verbose:
                 preview = response[:500] + "..." if len(response) > 500 else response
-                print(f"✅ Round {round_num + 1} - Response:\n{'-' * 40}\n{preview}\n{'-' * 40}")
+                logger.info("✅ Round %d - Response:\n%s", round_num + 1, preview)
 
-            thinking = extract_thinking(response)
-            if thinking:
-                await emit({
-                    "type": "thinking",
-                    "content": thinking,  # Never truncate thinking content
-                    "round": round_num + 1,
-                    "max_rounds": max_rounds,
-                })
+            if on_event is not None:
+                thinking = extract_thinking(response)
+                if thinking:
+                    await on_event({
+                        "type": "thinking",
+                        "content": thinking,  # Never truncate thinking content
+                        **round_info,
+                    })
 
             tool_calls = parse_tool_calls(response)
 
             if not tool_calls:
-                final_content = extract_final_response(response)
+                final_content, had_thinking = _clean_response(response)
 
                 if (
-                    "<think>" in response
+                    had_thinking
                     and len(final_content) < 50
                     and round_num < 3
-                    and profile.tools
+                    and has_tools
                 ):
                     if verbose:
-                        print("🔄 Model thinking without acting, nudging...")
-                    conversation.append(ChatMessage("assistant", response))
-                    conversation.append(
-                        ChatMessage("user", "Now use your tools to help answer the question.")
+                        logger.info("🔄 Model thinking without acting, nudging...")
+                    messages.append({"role": "assistant", "content": response})
+                    messages.append(
+                        {"role": "user", "content": "Now use your tools to help answer the question."}
                     )
                     continue
 
@@ -444,64 +601,54 @@ class ChatService:
                 )
 
             if verbose:
-                print(f"🔧 Found {len(tool_calls)} tool call(s):")
+                logger.info("🔧 Found %d tool call(s):", len(tool_calls))
                 for tc in tool_calls:
-                    print(f"   - {tc.name}({tc.arguments})")
+                    logger.info("   - %s(%s)", tc.name, tc.arguments)
 
             round_results: list[ToolResult] = []
             for tc in tool_calls:
-                truncated_args = _truncate_args(tc.arguments)
-                await emit({
-                    "type": "tool_start",
-                    "tool_name": tc.name,
-                    "tool_args": truncated_args,
-                    "round": round_num + 1,
-                    "max_rounds": max_rounds,
-                })
-
-                result = await self._registry.execute_async(tc.name, tc.arguments)
+                # Arguments and results are streamed in full; the UI handles display
+                if on_event is not None:
+                    await on_event({
+                        "type": "tool_start",
+                        "tool_name": tc.name,
+                        "tool_args": tc.arguments,
+                        **round_info,
+                    })
+
+                if tc.name in profile.tool_names_set:
+                    result = await self._registry.execute_async(tc.name, tc.arguments)
+                else:
+                    result = _unavailable_tool_result(tc.name, profile)
                 round_results.append(ToolResult(tc.name, result))
                 all_tool_calls.append(tc)
                 all_tool_results.append(round_results[-1])
 
-                await emit({
-                    "type": "tool_end",
-                    "tool_name": tc.name,
-                    "tool_result": _truncate_result(result),
-                    "round": round_num + 1,
-                    "max_rounds": max_rounds,
-                })
+                if on_event is not None:
+                    await on_event({
+                        "type": "tool_end",
+                        "tool_name": tc.name,
+                        "tool_result": result,
+                        **round_info,
+                    })
 
             if verbose:
-                print("📦 Tool results:")
+                logger.info("📦 Tool results:")
                 for tr in round_results:
-                    preview = tr.result[:200]
-                    print(f"   - {tr.tool_name}: {preview}")
+                    logger.info("   - %s: %s", tr.tool_name, tr.result[:200])
 
-            conversation.append(ChatMessage("assistant", response))
-            conversation.append(ChatMessage("user", format_tool_results(round_results)))
+            messages.append({"role": "assistant", "content": response})
+            messages.append({"role": "user", "content": format_tool_results(round_results)})
 
         return ChatResponse(
             content=extract_final_response(response),
             tool_calls=tuple(all_tool_calls),
             tool_results=tuple(all_tool_results),
-            rounds_used=profile.max_tool_rounds,
+            rounds_used=max_rounds,
             finished=False,
         )
 
 
-def _truncate_args(args: dict[str, Any], max_len: int = 0) -> dict[str, Any]:
-    """Return full argument values for SSE streaming (no truncation)."""
-    # Never truncate - UI can handle display
-    return args
-
-
-def _truncate_result(result: str, max_len: int = 0) -> str:
-    """Return full tool result for SSE streaming (no truncation)."""
-    # Never truncate - UI can handle display
-    return result
-
-
 # --- Factory Functions ---
 
 
@@ -515,7 +662,7 @@ def create_chat_service(model_size: ModelSize = ModelSize.LARGE) -> ChatService:
 # --- Standalone Test ---
 
 if __name__ == "__main__":
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     model_size = ModelSize.LARGE
     if len(sys.argv) > 1:
@@ -523,6 +670,7 @@ if __name__ == "__main__":
             "small": ModelSize.SMALL,
             "medium": ModelSize.MEDIUM,
             "large": ModelSize.LARGE,
+            "large-3bit": ModelSize.LARGE_3BIT,
         }
         model_size = size_map.get(sys.argv[1], ModelSize.LARGE)
 
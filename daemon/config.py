@@ -10,6 +10,10 @@ This file provides backwards compatibility re-exports.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 # Re-export from new locations for backwards compatibility
 from .chat import ModelSize
 from .tools import ToolSpec, get_registry
@@ -36,59 +40,19 @@ def get_tools_for_profile(profile_name: str) -> tuple[ToolSpec, ...]:
     profile = get_profile(profile_name)
     if profile is None:
         return ()
-    return tuple(t.spec for t in profile.tools)
+    return profile.tool_specs
 
 
 # Build ALL_TOOL_SPECS from registry
-def _build_all_tool_specs() -> dict[str, ToolSpec]:
+def _build_all_tool_specs() -> Mapping[str, ToolSpec]:
     registry = get_registry()
-    return registry.get_all_specs()
-
-
-# Lazy initialization to avoid circular imports
-_ALL_TOOL_SPECS: dict[str, ToolSpec] | None = None
-
-
-def _get_all_tool_specs() -> dict[str, ToolSpec]:
-    global _ALL_TOOL_SPECS
-    if _ALL_TOOL_SPECS is None:
-        _ALL_TOOL_SPECS = _build_all_tool_specs()
-    return _ALL_TOOL_SPECS
-
-
-# This will be populated on first access
-class _LazyToolSpecsDict(dict):
-    """Lazy dict that loads tool specs on first access."""
-    _loaded = False
-    
-    def _ensure_loaded(self):
-        if not self._loaded:
-            self.update(_get_all_tool_specs())
-            self._loaded = True
-    
-    def __getitem__(self, key):
-        self._ensure_loaded()
-        return super().__getitem__(key)
-    
-    def __iter__(self):
-        self._ensure_loaded()
-        return super().__iter__()
-    
-    def __len__(self):
-        self._ensure_loaded()
-        return super().__len__()
-    
-    def keys(self):
-        self._ensure_loaded()
-        return super().keys()
-    
-    def values(self):
-        self._ensure_loaded()
-        return super().values()
-    
-    def items(self):
-        self._ensure_loaded()
-        return super().items()
+    return MappingProxyType(registry.get_all_specs())
 
 
-ALL_TOOL_SPECS = _LazyToolSpecsDict()
+def __getattr__(name: str) -> Any:
+    # ALL_TOOL_SPECS is built on first access (avoids circular imports) and
+    # then cached as a module global, so later lookups never come back here
+    if name == "ALL_TOOL_SPECS":
+        specs = globals()["ALL_TOOL_SPECS"] = _build_all_tool_specs()
+        return specs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
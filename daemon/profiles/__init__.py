@@ -6,30 +6,82 @@ Each profile is a module that imports tools and defines:
 - Tool set (via imports from daemon.tools)
 - Auxiliary algorithms for context augmentation
 
-Profiles are pure configuration - no side effects.
+Profiles are pure configuration - no side effects. Profile modules are
+imported on first access, so personas that are never used never load their
+prompts or tool modules.
 """
 
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
 from .base import Profile
-from .mirror import PROFILE as mirror
-from .code_runner import PROFILE as code_runner
-from .general import PROFILE as general
-
-# All profiles exported from this package
-ALL_PROFILES: dict[str, Profile] = {
-    "mirror": mirror,
-    "code_runner": code_runner,
-    "general": general,
+
+# Profile name -> module defining its PROFILE constant
+_PROFILE_MODULES: dict[str, str] = {
+    "mirror": ".mirror",
+    "code_runner": ".code_runner",
+    "general": ".general",
 }
 
 
+class _LazyProfiles(Mapping[str, Profile]):
+    """Read-only mapping that imports each profile module on first access."""
+
+    def __init__(self, modules: Mapping[str, str]) -> None:
+        self._modules = modules
+        self._loaded: dict[str, Profile] = {}
+
+    def __getitem__(self, name: str) -> Profile:
+        profile = self._loaded.get(name)
+        if profile is None:
+            module = importlib.import_module(self._modules[name], __package__)
+            profile = self._loaded[name] = module.PROFILE
+            # Keep the package attribute bound to the profile, not the module
+            globals()[name] = profile
+        return profile
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+# All profiles exported from this package (read-only, so per-profile
+# caches built from it never go stale)
+ALL_PROFILES: Mapping[str, Profile] = _LazyProfiles(_PROFILE_MODULES)
+
+
 def get_profile(name: str) -> Profile | None:
     """Get a profile by name."""
-    return ALL_PROFILES.get(name)
+    if name not in _PROFILE_MODULES:
+        return None
+    return ALL_PROFILES[name]
 
 
 def list_profiles() -> list[str]:
     """List all available profile names."""
-    return list(ALL_PROFILES.keys())
+    return list(_PROFILE_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy access to the per-profile exports (e.g. `profiles.mirror`)
+    if name in _PROFILE_MODULES:
+        return ALL_PROFILES[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if TYPE_CHECKING:
+    # Declared for type checkers; resolved at runtime by __getattr__
+    mirror: Profile
+    code_runner: Profile
+    general: Profile
 
 
 __all__ = [
@@ -10,18 +10,96 @@ A Profile bundles:
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections import ChainMap
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from importlib import resources
 from typing import Any, Callable
 
-from daemon.tools import Tool
+from daemon.tools import Tool, ToolSpec
 
 
 # Type for auxiliary context algorithms
-# Takes current context dict, returns augmented context dict
-ContextAugmenter = Callable[[dict[str, Any]], dict[str, Any]]
+# Takes a read-only view of the context so far, returns only the keys it
+# adds or overrides
+ContextAugmenter = Callable[[Mapping[str, Any]], dict[str, Any]]
 
 
-@dataclass(frozen=True)
+@functools.cache
+def load_prompt(name: str) -> str:
+    """
+    Load a system prompt from the prompts/ directory.
+    
+    Prompts live in plain text files rather than .py literals so they stay
+    out of the bytecode; each file is read at most once.
+    """
+    path = resources.files(__package__).joinpath("prompts", f"{name}.txt")
+    return path.read_text(encoding="utf-8").removesuffix("\n")
+
+
+def format_tools_prompt(tools: tuple[Tool, ...], compact: bool = False) -> str:
+    """
+    Format tool specs into system prompt section.
+
+    With compact=True, tools are listed as one-line signatures instead of
+    JSON Schema, trading parameter descriptions for fewer prompt tokens.
+    """
+    if not tools:
+        return ""
+
+    if compact:
+        signatures = "\n".join(tool.spec.to_compact() for tool in tools)
+        intro = (
+            "You are provided with function signatures within <tools></tools> "
+            "XML tags, one per line as name(param:type, ...): description. "
+            "Parameters marked * are required:"
+        )
+    else:
+        signatures = "\n".join(tool.to_schema_json() for tool in tools)
+        intro = "You are provided with function signatures within <tools></tools> XML tags:"
+
+    return f"""
+
+# Tools
+
+You may call one or more functions to assist with the user query.
+
+{intro}
+<tools>
+{signatures}
+</tools>
+
+For each function call, return a json object with function name and arguments within <tool_call></tool_call> XML tags:
+<tool_call>
+{{"name": "<function-name>", "arguments": {{"<arg1>": "<value1>"}}}}
+</tool_call>"""
+
+
+def _compose_augmenters(
+    augmenters: tuple[ContextAugmenter, ...],
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """
+    Fold augmenters into one function returning an augmented copy.
+
+    Augmenters write into a small overlay read through a ChainMap, so the
+    context itself is copied once at the end rather than per augmenter.
+    """
+    if not augmenters:
+        return dict.copy
+
+    def composed(context: dict[str, Any]) -> dict[str, Any]:
+        overlay: dict[str, Any] = {}
+        view = ChainMap(overlay, context)
+        for augmenter in augmenters:
+            overlay.update(augmenter(view))
+        return {**context, **overlay}
+
+    return composed
+
+
+@dataclass(frozen=True, slots=True)
 class Profile:
     """
     Immutable agent profile configuration.
@@ -31,6 +109,11 @@ class Profile:
     - Tools: Imported from daemon.tools modules
     - Settings: Inference parameters
     - Augmenters: Optional deterministic context augmentation
+
+    The system prompt must stay static: together with the tool schemas it
+    forms the prompt prefix whose KV cache the model reuses across turns.
+    Per-request context (dates, sync timestamps, user details) belongs in
+    the user message, never in the system prompt.
     """
     name: str
     system_prompt: str
@@ -43,10 +126,39 @@ class Profile:
     # augment the context before sending to the LLM
     context_augmenters: tuple[ContextAugmenter, ...] = field(default=())
 
+    # Render tools as compact one-line signatures instead of JSON Schema
+    compact_tools: bool = False
+
+    _tool_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Tool names as a set, for O(1) checks on every model tool call
+    tool_names_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Specs of the profile's tools, shared by every caller
+    tool_specs: tuple[ToolSpec, ...] = field(init=False, repr=False, compare=False)
+    # System prompt plus tool schemas, rendered once; every turn reuses it
+    rendered_system_prompt: str = field(init=False, repr=False, compare=False)
+    # context_augmenters precomposed into a single callable
+    _augment: Callable[[dict[str, Any]], dict[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "_tool_names", tuple(t.name for t in self.tools))
+        object.__setattr__(self, "tool_names_set", frozenset(self._tool_names))
+        object.__setattr__(self, "tool_specs", tuple(t.spec for t in self.tools))
+        object.__setattr__(
+            self,
+            "rendered_system_prompt",
+            self.system_prompt + format_tools_prompt(self.tools, self.compact_tools),
+        )
+        object.__setattr__(
+            self, "_augment", _compose_augmenters(self.context_augmenters)
+        )
+
     @property
     def tool_names(self) -> tuple[str, ...]:
         """Get names of all tools in this profile."""
-        return tuple(t.name for t in self.tools)
+        return self._tool_names
 
     def augment_context(self, context: dict[str, Any]) -> dict[str, Any]:
         """
@@ -56,7 +168,4 @@ class Profile:
         context before it's sent to the LLM (e.g., adding current time,
         recent activity summaries, etc.)
         """
-        result = context.copy()
-        for augmenter in self.context_augmenters:
-            result = augmenter(result)
-        return result
+        return self._augment(context)
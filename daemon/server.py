@@ -18,12 +18,13 @@ Startup behavior:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import threading
 import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Literal
+from typing import Annotated, Any, AsyncIterator, Literal
 
 # Configure logging
 logging.basicConfig(
@@ -33,26 +34,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger('qwen.server')
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .tools import get_registry, ToolSpec
 from .profiles import ALL_PROFILES, get_profile
 from .chat import (
-    ChatMessage,
+    ChatResponse,
     ChatService,
     create_chat_service,
     ModelSize,
 )
-from .sessions import get_session_store, Session
+from .sessions import get_session_store, Session, SessionStore
 
 # Import session context functions for tool execution
 from .tools.mirror.data_store import set_session_context, reset_session_context
 
+# Request lookup tables, built once rather than per request
+_SIZE_MAP: dict[str, ModelSize] = {
+    "small": ModelSize.SMALL,
+    "medium": ModelSize.MEDIUM,
+    "large": ModelSize.LARGE,
+    "large-3bit": ModelSize.LARGE_3BIT,
+}
+_PROFILE_NAMES: frozenset[str] = frozenset(ALL_PROFILES)
+
+# All response/SSE encoding goes through this. OPT_NON_STR_KEYS keeps parity
+# with stdlib json for tool arguments that carry non-string keys.
+_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+
+# Chat services (and so model weights) kept resident; switching to another
+# size beyond this evicts the least recently used one.
+_MAX_RESIDENT_MODELS = 1
+
 
 # --- Request/Response Models ---
 
+# Response models are only built by handlers: freeze them and reject
+# unexpected fields. (Pydantic models can't use __slots__.) Most now only
+# describe OpenAPI schemas for endpoints that return pre-encoded bytes, so
+# their core schema is built on first use rather than at import.
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
 
 class ChatMessageInput(BaseModel):
     """Input message in conversation history."""
@@ -75,17 +100,24 @@ class ChatRequest(BaseModel):
     message: str = Field(..., description="User message to process")
     profile: str = Field(default="general", description="Agent profile name")
     model_size: str = Field(
-        default="large", description="Model size: small, medium, large"
+        default="large", description="Model size: small, medium, large, large-3bit"
     )
     history: list[ChatMessageInput] = Field(
         default_factory=_empty_history, description="Prior conversation history"
     )
     verbose: bool = Field(default=False, description="Enable verbose logging")
 
+    @field_validator("model_size")
+    @classmethod
+    def _normalize_model_size(cls, value: str) -> str:
+        return value.lower()
+
 
 class ChatResponseModel(BaseModel):
     """Response body for /v1/chat endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     content: str = Field(..., description="Final response content")
     tool_calls: list[dict[str, Any]] = Field(
         default_factory=_empty_dict_list, description="Tool calls made"
@@ -118,6 +150,8 @@ class LegacyToolInvokeRequest(BaseModel):
 class ToolInvokeResponse(BaseModel):
     """Response body for tool invocation endpoints."""
 
+    model_config = _RESPONSE_CONFIG
+
     tool_name: str
     result: Any
     latency_ms: float
@@ -126,6 +160,8 @@ class ToolInvokeResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Response body for /health endpoint."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str
     model_loaded: bool
     model_size: str | None
@@ -137,6 +173,8 @@ class HealthResponse(BaseModel):
 class ProfileInfo(BaseModel):
     """Info about an agent profile."""
 
+    model_config = _RESPONSE_CONFIG
+
     name: str
     system_prompt_preview: str
     tool_names: list[str]
@@ -146,6 +184,8 @@ class ProfileInfo(BaseModel):
 class ToolInfo(BaseModel):
     """Info about a tool."""
 
+    model_config = _RESPONSE_CONFIG
+
     name: str
     description: str
     parameters: dict[str, Any]
@@ -161,6 +201,8 @@ def _empty_tool_list() -> list[dict[str, Any]]:
 class SessionMessageModel(BaseModel):
     """A message within a session."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     role: str
     content: str
@@ -176,6 +218,8 @@ def _empty_message_list() -> list[SessionMessageModel]:
 class SessionModel(BaseModel):
     """A conversation session."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     profile_name: str
     created_at: float
@@ -187,6 +231,8 @@ class SessionModel(BaseModel):
 class SessionSummaryModel(BaseModel):
     """Session summary without full messages."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     profile_name: str
     title: str | None
@@ -205,13 +251,20 @@ class SessionChatRequest(BaseModel):
     """Request to send a message in a session."""
 
     message: str = Field(..., description="User message")
-    model_size: str = Field(default="large", description="Model size: small, medium, large")
+    model_size: str = Field(default="large", description="Model size: small, medium, large, large-3bit")
     verbose: bool = Field(default=False, description="Enable verbose logging")
 
+    @field_validator("model_size")
+    @classmethod
+    def _normalize_model_size(cls, value: str) -> str:
+        return value.lower()
+
 
 class QueueStats(BaseModel):
     """Statistics about queue wait time for a request."""
 
+    model_config = _RESPONSE_CONFIG
+
     was_queued: bool = Field(
         ..., description="Whether this request had to wait in queue"
     )
@@ -226,6 +279,8 @@ class QueueStats(BaseModel):
 class SessionChatResponse(BaseModel):
     """Response from session chat."""
 
+    model_config = _RESPONSE_CONFIG
+
     session: SessionModel
     response: ChatResponseModel
     queue_stats: QueueStats = Field(
@@ -240,6 +295,8 @@ def _empty_queued_list() -> list[str]:
 class GenerationStatus(BaseModel):
     """Current generation queue status."""
 
+    model_config = _RESPONSE_CONFIG
+
     generating_session_id: str | None = Field(
         None, description="Session ID currently generating, or null if idle"
     )
@@ -253,7 +310,13 @@ class GenerationStatus(BaseModel):
 
 
 class GenerationEvent(BaseModel):
-    """Server-Sent Event for generation progress."""
+    """Server-Sent Event for generation progress.
+
+    Schema reference only: frames are encoded from plain dicts by _sse(),
+    which omits fields that do not apply to the event type.
+    """
+
+    model_config = _RESPONSE_CONFIG
 
     type: Literal["round_start", "generating", "tool_start", "tool_end", "complete", "error"]
     round: int | None = Field(None, description="Current round number (1-indexed)")
@@ -274,16 +337,24 @@ class AppState:
     """Mutable application state with generation lock and queue tracking."""
 
     def __init__(self) -> None:
+        # LRU of chat services, least recently used first. Each service pins
+        # its model's weights, so at most _MAX_RESIDENT_MODELS are kept.
         self._chat_services: dict[ModelSize, ChatService] = {}
         self._current_model_size: ModelSize | None = None
         self._model_loaded: bool = False
+        # asyncio.Lock hands off to waiters in FIFO order and does not let a
+        # new acquirer barge past queued ones, so it serves the queue in
+        # add_to_queue order.
         self._generation_lock: asyncio.Lock = asyncio.Lock()
         self._generation_in_progress: bool = False
         self._generating_session_id: str | None = None
-        self._queued_session_ids: list[str] = []
         self._queue_lock: threading.Lock = threading.Lock()
-        self._position_map: dict[str, int] = {}
-        self._next_position: int = 0
+        # session_id -> queue position; dict insertion order is queue order
+        self._queue: dict[str, int] = {}
+        # Immutable status republished after each mutation; read without the lock
+        self._status_snapshot: GenerationStatus = GenerationStatus(
+            generating_session_id=None
+        )
 
     @property
     def generation_lock(self) -> asyncio.Lock:
@@ -303,48 +374,67 @@ class AppState:
             elif not value:
                 logger.info(f"✅ Generation FINISHED for session {self._generating_session_id[:8] if self._generating_session_id else 'unknown'}")
                 self._generating_session_id = None
+            self._publish_status()
 
     def add_to_queue(self, session_id: str) -> int:
         with self._queue_lock:
-            if session_id in self._position_map:
-                return self._position_map[session_id]
+            position = self._queue.get(session_id)
+            if position is not None:
+                return position
 
-            position = self._next_position
-            self._next_position += 1
-            self._position_map[session_id] = position
-            if session_id not in self._queued_session_ids:
-                self._queued_session_ids.append(session_id)
+            # Number of sessions ahead (generating or waiting); 0 = immediate
+            position = len(self._queue)
+            self._queue[session_id] = position
+            self._publish_status()
 
             logger.info(f"📥 Session {session_id[:8]} added to queue at position {position}")
             return position
 
     def remove_from_queue(self, session_id: str) -> None:
         with self._queue_lock:
-            if session_id in self._queued_session_ids:
-                self._queued_session_ids.remove(session_id)
-            if session_id in self._position_map:
-                del self._position_map[session_id]
+            self._queue.pop(session_id, None)
             if self._generating_session_id == session_id:
                 self._generating_session_id = None
+            self._publish_status()
             logger.info(f"📤 Session {session_id[:8]} removed from queue")
 
-    def get_generation_status(self) -> GenerationStatus:
-        with self._queue_lock:
-            return GenerationStatus(
-                generating_session_id=self._generating_session_id,
-                queued_session_ids=list(self._queued_session_ids),
-            )
+    def _publish_status(self) -> None:
+        """Rebuild the status snapshot. Caller must hold _queue_lock."""
+        self._status_snapshot = GenerationStatus(
+            generating_session_id=self._generating_session_id,
+            queued_session_ids=list(self._queue),
+        )
 
-    def get_chat_service(self, model_size: ModelSize) -> ChatService:
-        if model_size not in self._chat_services:
+    def get_generation_status(self) -> GenerationStatus:
+        # Single attribute read of a snapshot that is never mutated in place
+        return self._status_snapshot
+
+    async def load_chat_service(self, model_size: ModelSize) -> ChatService:
+        """
+        Return the chat service for a model size with its weights loaded.
+
+        Caller must hold the generation lock: eviction then never drops a
+        model that is still generating, and model_loaded/current_model_size
+        only change once the weights are actually resident.
+        """
+        service = self._chat_services.pop(model_size, None)
+        if service is None:
+            while len(self._chat_services) >= _MAX_RESIDENT_MODELS:
+                evicted = next(iter(self._chat_services))
+                del self._chat_services[evicted]
+                logger.info(f"♻️ Evicted chat service for model size: {evicted.name}")
             logger.info(f"🔧 Creating new chat service for model size: {model_size.name}")
+            service = create_chat_service(model_size)
+        # Re-insert as most recently used
+        self._chat_services[model_size] = service
+        if not service.is_loaded:
             start_time = time.time()
-            self._chat_services[model_size] = create_chat_service(model_size)
+            await service.load_async()
             elapsed = time.time() - start_time
-            logger.info(f"✅ Chat service created in {elapsed:.1f}s")
+            logger.info(f"✅ Model {model_size.name} loaded in {elapsed:.1f}s")
         self._current_model_size = model_size
         self._model_loaded = True
-        return self._chat_services[model_size]
+        return service
 
     @property
     def model_loaded(self) -> bool:
@@ -375,9 +465,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     logger.info("   Loading model (this may take 30-60 seconds)...")
     start_time = time.time()
-    _ = app_state.get_chat_service(ModelSize.LARGE)
-    elapsed = time.time() - start_time
-    logger.info(f"   ✓ Model loaded and ready in {elapsed:.1f}s!")
+    # Weights load lazily; load them now on the generation thread instead
+    # of on the first request. A failure is logged and startup continues:
+    # /health reports model_loaded=false and the first chat retries.
+    try:
+        async with app_state.generation_lock:
+            await app_state.load_chat_service(ModelSize.LARGE)
+    except Exception as e:
+        logger.exception(
+            f"   ❌ Failed to load {ModelSize.LARGE.value} at startup: {e}. It will be loaded on the first chat request."
+        )
+    else:
+        elapsed = time.time() - start_time
+        logger.info(f"   ✓ Model loaded and ready in {elapsed:.1f}s!")
 
     # Start Google sync scheduler (runs every 5 minutes)
     try:
@@ -414,6 +514,17 @@ app = FastAPI(
 )
 
 
+def _json_response(payload: Any) -> Response:
+    """Encode a payload with orjson, skipping response_model validation.
+
+    orjson serializes dataclasses (Session, SessionMessage, ToolCall,
+    ToolResult) natively, so hot endpoints hand them over as-is instead of
+    copying them into the Pydantic response models, whose field names and
+    order they match.
+    """
+    return Response(content=_dumps(payload), media_type="application/json")
+
+
 # --- Health Endpoint ---
 
 
@@ -435,19 +546,33 @@ async def health_check() -> HealthResponse:
 # --- Tool API Endpoints (Local-Only) ---
 
 
-@app.get("/v1/tools", response_model=list[ToolInfo])
-async def list_tools() -> list[ToolInfo]:
-    """List all available tools with their specs."""
+def _tool_info(spec: ToolSpec) -> dict[str, Any]:
+    return ToolInfo(
+        name=spec.name,
+        description=spec.description,
+        parameters=spec.parameters,
+    ).model_dump()
+
+
+_tools_json_cache: tuple[int, bytes] | None = None
+
+
+def _get_tools_json() -> bytes:
+    """Encoded /v1/tools body, rebuilt only when the registry changes."""
+    global _tools_json_cache
     registry = get_registry()
-    specs = registry.get_all_specs()
-    return [
-        ToolInfo(
-            name=spec.name,
-            description=spec.description,
-            parameters=spec.parameters,
+    if _tools_json_cache is None or _tools_json_cache[0] != registry.version:
+        body = _dumps(
+            [_tool_info(spec) for spec in registry.get_all_specs().values()]
         )
-        for spec in specs.values()
-    ]
+        _tools_json_cache = (registry.version, body)
+    return _tools_json_cache[1]
+
+
+@app.get("/v1/tools", responses={200: {"model": list[ToolInfo]}})
+async def list_tools() -> Response:
+    """List all available tools with their specs."""
+    return Response(content=_get_tools_json(), media_type="application/json")
 
 
 @app.get("/v1/tools/{tool_name}", response_model=ToolInfo)
@@ -464,8 +589,36 @@ async def get_tool(tool_name: str) -> ToolInfo:
     )
 
 
-@app.post("/v1/tools/{tool_name}/invoke", response_model=ToolInvokeResponse)
-async def invoke_tool_by_name(tool_name: str, request: ToolInvokeRequest) -> ToolInvokeResponse:
+# Tool results above this size are decoded in a worker thread
+_LARGE_TOOL_RESULT = 64 * 1024
+
+
+def _loads_tool_result(result: str) -> Any:
+    """
+    Decode a tool's JSON string result, falling back to the raw string.
+
+    Tools encode with json.dumps, which emits NaN/Infinity tokens that
+    orjson rejects, so orjson failures are retried with json.loads.
+    """
+    try:
+        return orjson.loads(result)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        return json.loads(result)
+    except json.JSONDecodeError:
+        return result
+
+
+async def _parse_tool_result(result: str) -> Any:
+    """Decode a tool result, off the event loop when it is large."""
+    if len(result) > _LARGE_TOOL_RESULT:
+        return await asyncio.to_thread(_loads_tool_result, result)
+    return _loads_tool_result(result)
+
+
+@app.post("/v1/tools/{tool_name}/invoke", responses={200: {"model": ToolInvokeResponse}})
+async def invoke_tool_by_name(tool_name: str, request: ToolInvokeRequest) -> Response:
     """
     Invoke a specific tool directly (local-only API).
 
@@ -475,28 +628,23 @@ async def invoke_tool_by_name(tool_name: str, request: ToolInvokeRequest) -> Too
     start_time = time.perf_counter()
 
     registry = get_registry()
-    if tool_name not in registry.available_tools:
+    if tool_name not in registry:
         raise HTTPException(status_code=404, detail=f"Unknown tool: {tool_name}")
 
     result = await registry.execute_async(tool_name, request.arguments)
-
-    parsed_result: Any
-    try:
-        parsed_result = json.loads(result)
-    except json.JSONDecodeError:
-        parsed_result = result
+    parsed_result = await _parse_tool_result(result)
 
     latency_ms = (time.perf_counter() - start_time) * 1000
 
-    return ToolInvokeResponse(
-        tool_name=tool_name,
-        result=parsed_result,
-        latency_ms=latency_ms,
-    )
+    return _json_response({
+        "tool_name": tool_name,
+        "result": parsed_result,
+        "latency_ms": latency_ms,
+    })
 
 
-@app.post("/v1/invoke-tool", response_model=ToolInvokeResponse)
-async def invoke_tool_legacy(request: LegacyToolInvokeRequest) -> ToolInvokeResponse:
+@app.post("/v1/invoke-tool", responses={200: {"model": ToolInvokeResponse}})
+async def invoke_tool_legacy(request: LegacyToolInvokeRequest) -> Response:
     """
     Legacy tool invocation endpoint (for backwards compatibility).
 
@@ -505,33 +653,31 @@ async def invoke_tool_legacy(request: LegacyToolInvokeRequest) -> ToolInvokeResp
     start_time = time.perf_counter()
 
     registry = get_registry()
-    if request.tool_name not in registry.available_tools:
+    if request.tool_name not in registry:
         raise HTTPException(status_code=404, detail=f"Unknown tool: {request.tool_name}")
 
     result = await registry.execute_async(request.tool_name, request.arguments)
-
-    parsed_result: Any
-    try:
-        parsed_result = json.loads(result)
-    except json.JSONDecodeError:
-        parsed_result = result
+    parsed_result = await _parse_tool_result(result)
 
     latency_ms = (time.perf_counter() - start_time) * 1000
 
-    return ToolInvokeResponse(
-        tool_name=request.tool_name,
-        result=parsed_result,
-        latency_ms=latency_ms,
-    )
+    return _json_response({
+        "tool_name": request.tool_name,
+        "result": parsed_result,
+        "latency_ms": latency_ms,
+    })
 
 
 # --- Profile Endpoints ---
 
 
-@app.get("/v1/profiles", response_model=list[ProfileInfo])
-async def list_profiles() -> list[ProfileInfo]:
-    """List available agent profiles."""
-    return [
+# Profiles are immutable once loaded, so their listings are encoded once
+# (on first request, keeping profile imports lazy).
+
+
+@functools.cache
+def _get_profiles_json() -> bytes:
+    return _dumps([
         ProfileInfo(
             name=profile.name,
             system_prompt_preview=(
@@ -541,155 +687,124 @@ async def list_profiles() -> list[ProfileInfo]:
             ),
             tool_names=list(profile.tool_names),
             max_tool_rounds=profile.max_tool_rounds,
-        )
+        ).model_dump()
         for profile in ALL_PROFILES.values()
-    ]
+    ])
 
 
-@app.get("/v1/profiles/{profile_name}/tools", response_model=list[ToolInfo])
-async def get_profile_tools(profile_name: str) -> list[ToolInfo]:
-    """Get tools available for a specific profile."""
+@functools.lru_cache(maxsize=8)
+def _get_profile_tools_json(profile_name: str) -> bytes | None:
     profile = get_profile(profile_name)
     if profile is None:
-        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_name}")
+        return None
+    return _dumps([_tool_info(tool.spec) for tool in profile.tools])
 
-    return [
-        ToolInfo(
-            name=tool.name,
-            description=tool.description,
-            parameters=tool.parameters,
-        )
-        for tool in profile.tools
-    ]
+
+@app.get("/v1/profiles", responses={200: {"model": list[ProfileInfo]}})
+async def list_profiles() -> Response:
+    """List available agent profiles."""
+    return Response(content=_get_profiles_json(), media_type="application/json")
+
+
+@app.get("/v1/profiles/{profile_name}/tools", responses={200: {"model": list[ToolInfo]}})
+async def get_profile_tools(profile_name: str) -> Response:
+    """Get tools available for a specific profile."""
+    body = _get_profile_tools_json(profile_name)
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_name}")
+    return Response(content=body, media_type="application/json")
 
 
 # --- Chat Endpoint ---
 
 
-@app.post("/v1/chat", response_model=ChatResponseModel)
-async def chat(request: ChatRequest) -> ChatResponseModel:
+def _resolve_model_size(name: str) -> ModelSize:
+    """Map a (lowercased) model_size request field to ModelSize, or 400."""
+    model_size = _SIZE_MAP.get(name)
+    if model_size is None:
+        raise HTTPException(status_code=400, detail=f"Invalid model_size: {name}")
+    return model_size
+
+
+@app.post("/v1/chat", responses={200: {"model": ChatResponseModel}})
+async def chat(request: ChatRequest) -> Response:
     """Chat completion endpoint."""
     start_time = time.perf_counter()
 
-    size_map: dict[str, ModelSize] = {
-        "small": ModelSize.SMALL,
-        "medium": ModelSize.MEDIUM,
-        "large": ModelSize.LARGE,
-    }
-    model_size = size_map.get(request.model_size.lower())
-    if model_size is None:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid model_size: {request.model_size}"
-        )
+    model_size = _resolve_model_size(request.model_size)
 
-    if request.profile not in ALL_PROFILES:
+    if request.profile not in _PROFILE_NAMES:
         raise HTTPException(
             status_code=400, detail=f"Unknown profile: {request.profile}"
         )
 
-    service = app_state.get_chat_service(model_size)
-
-    history: list[ChatMessage] = [
-        ChatMessage(m.role, m.content) for m in request.history
-    ]
+    # Stateless chat doesn't queue for generation, but switching or loading
+    # the resident model must not happen under a running generation
+    async with app_state.generation_lock:
+        service = await app_state.load_chat_service(model_size)
 
     result = await service.chat_async(
         user_message=request.message,
         profile_name=request.profile,
-        conversation_history=history,
+        conversation_history=request.history,
         verbose=request.verbose,
     )
 
     latency_ms = (time.perf_counter() - start_time) * 1000
 
-    return ChatResponseModel(
-        content=result.content,
-        tool_calls=[
-            {"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls
-        ],
-        tool_results=[
-            {"tool_name": tr.tool_name, "result": tr.result}
-            for tr in result.tool_results
-        ],
-        rounds_used=result.rounds_used,
-        finished=result.finished,
-        latency_ms=latency_ms,
-    )
+    # ToolCall/ToolResult are dataclasses with the response's field names,
+    # so orjson encodes them directly
+    return _json_response({
+        "content": result.content,
+        "tool_calls": result.tool_calls,
+        "tool_results": result.tool_results,
+        "rounds_used": result.rounds_used,
+        "finished": result.finished,
+        "latency_ms": latency_ms,
+    })
 
 
 # --- Session Endpoints ---
 
 
-def _session_to_model(session: Session) -> SessionModel:
-    """Convert internal Session to Pydantic SessionModel."""
-    return SessionModel(
-        id=session.id,
-        profile_name=session.profile_name,
-        created_at=session.created_at,
-        updated_at=session.updated_at,
-        title=session.title,
-        messages=[
-            SessionMessageModel(
-                id=msg.id,
-                role=msg.role,
-                content=msg.content,
-                timestamp=msg.timestamp,
-                tool_calls=msg.tool_calls,
-                tool_results=msg.tool_results,
-            )
-            for msg in session.messages
-        ],
-    )
-
-
 @app.get("/v1/generation/status", response_model=GenerationStatus)
 async def get_generation_status() -> GenerationStatus:
     """Get current generation queue status."""
     return app_state.get_generation_status()
 
 
-@app.get("/v1/sessions", response_model=list[SessionSummaryModel])
-async def list_sessions(limit: int = 50) -> list[SessionSummaryModel]:
+@app.get("/v1/sessions", responses={200: {"model": list[SessionSummaryModel]}})
+async def list_sessions(limit: int = 50) -> Response:
     """List all sessions (summaries only, sorted by most recent)."""
     store = get_session_store()
     pruned = store.prune_empty(max_age_seconds=60)
     if pruned > 0:
         logger.info(f"🗑️ Pruned {pruned} empty session(s)")
-    summaries = store.list_summaries(limit=limit)
-    return [
-        SessionSummaryModel(
-            id=s["id"],
-            profile_name=s["profile_name"],
-            title=s["title"],
-            created_at=s["created_at"],
-            updated_at=s["updated_at"],
-            message_count=s["message_count"],
-        )
-        for s in summaries
-    ]
+    # list_summaries already yields dicts with SessionSummaryModel's fields
+    return _json_response(store.list_summaries(limit=limit))
 
 
-@app.post("/v1/sessions", response_model=SessionModel)
-async def create_session(request: CreateSessionRequest) -> SessionModel:
+@app.post("/v1/sessions", responses={200: {"model": SessionModel}})
+async def create_session(request: CreateSessionRequest) -> Response:
     """Create a new session."""
-    if request.profile_name not in ALL_PROFILES:
+    if request.profile_name not in _PROFILE_NAMES:
         raise HTTPException(
             status_code=400, detail=f"Unknown profile: {request.profile_name}"
         )
 
     store = get_session_store()
     session = store.create(request.profile_name)
-    return _session_to_model(session)
+    return _json_response(session)
 
 
-@app.get("/v1/sessions/{session_id}", response_model=SessionModel)
-async def get_session(session_id: str) -> SessionModel:
+@app.get("/v1/sessions/{session_id}", responses={200: {"model": SessionModel}})
+async def get_session(session_id: str) -> Response:
     """Get a session by ID."""
     store = get_session_store()
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
-    return _session_to_model(session)
+    return _json_response(session)
 
 
 @app.delete("/v1/sessions/{session_id}")
@@ -702,40 +817,53 @@ async def delete_session(session_id: str) -> dict[str, bool]:
     return {"deleted": True}
 
 
-@app.post("/v1/sessions/{session_id}/chat", response_model=SessionChatResponse)
-async def session_chat(session_id: str, request: SessionChatRequest) -> SessionChatResponse:
-    """Send a message in a session."""
-    start_time = time.perf_counter()
-    logger.info(f"📨 POST /v1/sessions/{session_id[:8]}.../chat")
+SessionChatContext = tuple[Session, ModelSize, SessionStore]
 
-    size_map: dict[str, ModelSize] = {
-        "small": ModelSize.SMALL,
-        "medium": ModelSize.MEDIUM,
-        "large": ModelSize.LARGE,
-    }
-    model_size = size_map.get(request.model_size.lower())
-    if model_size is None:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid model_size: {request.model_size}"
-        )
+
+def _resolve_session_chat(
+    session_id: str, request: SessionChatRequest
+) -> SessionChatContext:
+    """
+    Shared preamble for the session chat endpoints.
+
+    Validates model_size, loads the session and checks its profile. Declared
+    sync so FastAPI runs it in the threadpool, keeping the session file read
+    off the event loop.
+    """
+    model_size = _resolve_model_size(request.model_size)
 
     store = get_session_store()
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
-    if session.profile_name not in ALL_PROFILES:
+    if session.profile_name not in _PROFILE_NAMES:
         raise HTTPException(
             status_code=400, detail=f"Unknown profile: {session.profile_name}"
         )
+    return session, model_size, store
+
+
+@app.post("/v1/sessions/{session_id}/chat", responses={200: {"model": SessionChatResponse}})
+async def session_chat(
+    session_id: str,
+    request: SessionChatRequest,
+    ctx: Annotated[SessionChatContext, Depends(_resolve_session_chat)],
+) -> Response:
+    """Send a message in a session."""
+    start_time = time.perf_counter()
+    logger.info(f"📨 POST /v1/sessions/{session_id[:8]}.../chat")
+    session, model_size, store = ctx
 
     session.add_message(role="user", content=request.message)
 
+    # Only generation itself needs the lock; resolve everything else first.
+    # Stored messages already expose role/content; no per-turn copy
+    history = session.messages[:-1]
+
     queue_position = app_state.add_to_queue(session_id)
     queue_enter_time = time.perf_counter()
 
-    await asyncio.sleep(0)
-
     acquired_lock = False
 
     try:
@@ -750,13 +878,7 @@ async def session_chat(session_id: str, request: SessionChatRequest) -> SessionC
 
                 app_state.set_generating(True, session_id=session_id)
                 try:
-                    service = app_state.get_chat_service(model_size)
-
-                    history: list[ChatMessage] = [
-                        ChatMessage(msg.role, msg.content)
-                        for msg in session.messages[:-1]
-                    ]
-
+                    service = await app_state.load_chat_service(model_size)
                     context_token = set_session_context(session_id)
                     try:
                         result = await service.chat_async(
@@ -767,16 +889,6 @@ async def session_chat(session_id: str, request: SessionChatRequest) -> SessionC
                         )
                     finally:
                         reset_session_context(context_token)
-
-                    session.add_message(
-                        role="assistant",
-                        content=result.content,
-                        tool_calls=[{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls],
-                        tool_results=[{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results],
-                    )
-
-                    store.save(session)
-
                 finally:
                     app_state.set_generating(False)
                     app_state.remove_from_queue(session_id)
@@ -794,77 +906,95 @@ async def session_chat(session_id: str, request: SessionChatRequest) -> SessionC
                 detail="Generation timed out after 30 minutes.",
             )
 
-    latency_ms = (time.perf_counter() - start_time) * 1000
-
-    chat_response = ChatResponseModel(
+    # Persist after releasing the lock so the next queued request isn't
+    # held up by disk I/O; the write itself runs off the event loop.
+    tool_calls = [{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls]
+    tool_results = [{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results]
+    session.add_message(
+        role="assistant",
         content=result.content,
-        tool_calls=[{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls],
-        tool_results=[{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results],
-        rounds_used=result.rounds_used,
-        finished=result.finished,
-        latency_ms=latency_ms,
+        tool_calls=tool_calls,
+        tool_results=tool_results,
     )
+    await asyncio.to_thread(store.save, session)
 
-    queue_stats = QueueStats(
-        was_queued=was_queued,
-        queue_wait_ms=queue_wait_ms,
-        queue_position=queue_position,
-    )
+    latency_ms = (time.perf_counter() - start_time) * 1000
 
-    return SessionChatResponse(
-        session=_session_to_model(session),
-        response=chat_response,
-        queue_stats=queue_stats,
-    )
+    # Same shape as ChatResponseModel/QueueStats; the tool lists stored on
+    # the session are reused as-is rather than validated and dumped again
+    return _json_response({
+        "session": session,
+        "response": {
+            "content": result.content,
+            "tool_calls": tool_calls,
+            "tool_results": tool_results,
+            "rounds_used": result.rounds_used,
+            "finished": result.finished,
+            "latency_ms": latency_ms,
+        },
+        "queue_stats": {
+            "was_queued": was_queued,
+            "queue_wait_ms": queue_wait_ms,
+            "queue_position": queue_position,
+        },
+    })
+
+
+def _sse(event: dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event frame (see GenerationEvent for the schema).
+
+    Events are plain dicts encoded by orjson; Session dataclasses are
+    serialized natively, and unset fields are omitted rather than null.
+    """
+    return b"data: " + _dumps(event) + b"\n\n"
+
+
+def _sse_error(message: str) -> bytes:
+    return _sse({"type": "error", "error": message, "timestamp": time.time()})
+
+
+# Upper bound for one coalesced write of queued SSE frames
+_SSE_FLUSH_BYTES = 16 * 1024
 
 
 @app.post("/v1/sessions/{session_id}/chat/stream")
-async def session_chat_stream(session_id: str, request: SessionChatRequest):
+async def session_chat_stream(
+    session_id: str,
+    request: SessionChatRequest,
+    ctx: Annotated[SessionChatContext, Depends(_resolve_session_chat)],
+):
     """Send a message and stream generation progress via Server-Sent Events."""
     start_time = time.perf_counter()
     logger.info(f"📨 POST /v1/sessions/{session_id[:8]}.../chat/stream")
-
-    size_map: dict[str, ModelSize] = {
-        "small": ModelSize.SMALL,
-        "medium": ModelSize.MEDIUM,
-        "large": ModelSize.LARGE,
-    }
-    model_size = size_map.get(request.model_size.lower())
-    if model_size is None:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid model_size: {request.model_size}"
-        )
-
-    store = get_session_store()
-    session = store.get(session_id)
-    if session is None:
-        raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
-
-    if session.profile_name not in ALL_PROFILES:
-        raise HTTPException(
-            status_code=400, detail=f"Unknown profile: {session.profile_name}"
-        )
+    session, model_size, store = ctx
 
     session.add_message(role="user", content=request.message)
 
+    # Only generation itself needs the lock; resolve everything else first
+    history = session.messages[:-1]
+
     queue_position = app_state.add_to_queue(session_id)
     queue_enter_time = time.perf_counter()
 
-    await asyncio.sleep(0)
-
     async def event_generator():
         nonlocal session
         acquired_lock = False
         was_queued = False
         queue_wait_ms = 0.0
 
-        event_queue: asyncio.Queue[dict] = asyncio.Queue()
+        # Frames are encoded on the producer side. Unbounded on purpose: a
+        # slow client must not stall generation while it holds the lock.
+        event_queue: asyncio.Queue[bytes] = asyncio.Queue()
 
-        async def on_event(event: dict) -> None:
-            await event_queue.put(event)
+        async def on_event(event: dict[str, Any]) -> None:
+            event_queue.put_nowait(_sse(event))
 
-        try:
-            async with asyncio.timeout(1800):
+        async def run_chat() -> ChatResponse:
+            # The lock is held by this task, not the generator: when a
+            # disconnect or timeout cancels it, it still waits for the
+            # generation thread to go idle (see QwenModel) before unlocking.
+            nonlocal acquired_lock, was_queued, queue_wait_ms
+            try:
                 async with app_state.generation_lock:
                     acquired_lock = True
                     lock_acquired_time = time.perf_counter()
@@ -872,97 +1002,107 @@ async def session_chat_stream(session_id: str, request: SessionChatRequest):
                     was_queued = queue_wait_ms > 10
 
                     app_state.set_generating(True, session_id=session_id)
-
                     try:
-                        service = app_state.get_chat_service(model_size)
-
-                        history: list[ChatMessage] = [
-                            ChatMessage(msg.role, msg.content)
-                            for msg in session.messages[:-1]
-                        ]
-
-                        async def run_chat():
-                            context_token = set_session_context(session_id)
-                            try:
-                                return await service.chat_async(
-                                    user_message=request.message,
-                                    profile_name=session.profile_name,
-                                    conversation_history=history,
-                                    verbose=request.verbose,
-                                    on_event=on_event,
-                                )
-                            finally:
-                                reset_session_context(context_token)
-
-                        chat_task = asyncio.create_task(run_chat())
-
-                        while not chat_task.done():
-                            try:
-                                event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                                yield f"data: {json.dumps(event)}\n\n"
-                            except asyncio.TimeoutError:
-                                continue
-
-                        while not event_queue.empty():
-                            event = event_queue.get_nowait()
-                            yield f"data: {json.dumps(event)}\n\n"
-
-                        result = await chat_task
-
-                        session.add_message(
-                            role="assistant",
-                            content=result.content,
-                            tool_calls=[{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls],
-                            tool_results=[{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results],
-                        )
-
-                        store.save(session)
-
-                        latency_ms = (time.perf_counter() - start_time) * 1000
-                        complete_event = GenerationEvent(
-                            type="complete",
-                            session=_session_to_model(session),
-                            response=ChatResponseModel(
-                                content=result.content,
-                                tool_calls=[{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls],
-                                tool_results=[{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results],
-                                rounds_used=result.rounds_used,
-                                finished=result.finished,
-                                latency_ms=latency_ms,
-                            ),
-                            queue_stats=QueueStats(
-                                was_queued=was_queued,
-                                queue_wait_ms=queue_wait_ms,
-                                queue_position=queue_position,
-                            ),
-                        )
-                        yield f"data: {complete_event.model_dump_json()}\n\n"
-
+                        service = await app_state.load_chat_service(model_size)
+                        context_token = set_session_context(session_id)
+                        try:
+                            return await service.chat_async(
+                                user_message=request.message,
+                                profile_name=session.profile_name,
+                                conversation_history=history,
+                                verbose=request.verbose,
+                                on_event=on_event,
+                            )
+                        finally:
+                            reset_session_context(context_token)
                     finally:
                         app_state.set_generating(False)
                         app_state.remove_from_queue(session_id)
+            finally:
+                # Cancelled while still waiting in the queue
+                if not acquired_lock:
+                    app_state.remove_from_queue(session_id)
+
+        chat_task = asyncio.create_task(run_chat())
+
+        try:
+            async with asyncio.timeout(1800):
+                # Block until either an event is queued or the chat
+                # finishes, instead of polling the queue on a timer.
+                get_task = asyncio.create_task(event_queue.get())
+                try:
+                    while not chat_task.done():
+                        await asyncio.wait(
+                            (chat_task, get_task),
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if get_task.done():
+                            # Coalesce frames that queued up meanwhile into
+                            # one write
+                            frames = [get_task.result()]
+                            size = len(frames[0])
+                            while size < _SSE_FLUSH_BYTES and not event_queue.empty():
+                                frame = event_queue.get_nowait()
+                                frames.append(frame)
+                                size += len(frame)
+                            yield b"".join(frames)
+                            get_task = asyncio.create_task(event_queue.get())
+                finally:
+                    get_task.cancel()
+
+                if not event_queue.empty():
+                    frames: list[bytes] = []
+                    while not event_queue.empty():
+                        frames.append(event_queue.get_nowait())
+                    yield b"".join(frames)
+
+                result = chat_task.result()
+
+            # Persist after releasing the lock so the next queued request
+            # isn't held up by disk I/O; the write itself runs off the loop.
+            tool_calls = [{"name": tc.name, "arguments": tc.arguments} for tc in result.tool_calls]
+            tool_results = [{"tool_name": tr.tool_name, "result": tr.result} for tr in result.tool_results]
+            session.add_message(
+                role="assistant",
+                content=result.content,
+                tool_calls=tool_calls,
+                tool_results=tool_results,
+            )
+            await asyncio.to_thread(store.save, session)
+
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            yield _sse({
+                "type": "complete",
+                "session": session,
+                "response": {
+                    "content": result.content,
+                    "tool_calls": tool_calls,
+                    "tool_results": tool_results,
+                    "rounds_used": result.rounds_used,
+                    "finished": result.finished,
+                    "latency_ms": latency_ms,
+                },
+                "queue_stats": {
+                    "was_queued": was_queued,
+                    "queue_wait_ms": queue_wait_ms,
+                    "queue_position": queue_position,
+                },
+                "timestamp": time.time(),
+            })
 
         except asyncio.TimeoutError:
             if not acquired_lock:
-                app_state.remove_from_queue(session_id)
-                error_event = GenerationEvent(
-                    type="error",
-                    error="Timed out after 30 minutes waiting for another request to finish.",
-                )
-                yield f"data: {error_event.model_dump_json()}\n\n"
+                yield _sse_error("Timed out after 30 minutes waiting for another request to finish.")
             else:
-                error_event = GenerationEvent(
-                    type="error",
-                    error="Generation timed out after 30 minutes.",
-                )
-                yield f"data: {error_event.model_dump_json()}\n\n"
+                yield _sse_error("Generation timed out after 30 minutes.")
         except Exception as e:
             logger.error(f"❌ [STREAM] Session {session_id[:8]} error: {e}")
-            error_event = GenerationEvent(
-                type="error",
-                error=str(e),
-            )
-            yield f"data: {error_event.model_dump_json()}\n\n"
+            yield _sse_error(str(e))
+        finally:
+            # Client disconnect or timeout: stop the orphaned chat. The
+            # cancel is non-blocking; the task releases the lock itself.
+            if not chat_task.done():
+                chat_task.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -980,26 +1120,28 @@ async def session_chat_stream(session_id: str, request: SessionChatRequest):
 
 def main() -> None:
     """Run the daemon server."""
-    import sys
+    import argparse
+
     import uvicorn
 
-    host = "127.0.0.1"
-    port = 5997
-
-    args = sys.argv[1:]
-    i = 0
-    while i < len(args):
-        if args[i] == "--host" and i + 1 < len(args):
-            host = args[i + 1]
-            i += 2
-        elif args[i] == "--port" and i + 1 < len(args):
-            port = int(args[i + 1])
-            i += 2
-        else:
-            i += 1
+    parser = argparse.ArgumentParser(description="Run the Qwen daemon server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=5997, help="Bind port")
+    # "auto" selects uvloop/httptools when installed (see requirements.txt)
+    parser.add_argument(
+        "--loop", default="auto", choices=["auto", "asyncio", "uvloop"],
+        help="Event loop implementation",
+    )
+    parser.add_argument(
+        "--http", default="auto", choices=["auto", "h11", "httptools"],
+        help="HTTP protocol implementation",
+    )
+    args = parser.parse_args()
 
-    print(f"Starting Qwen Daemon on {host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    print(f"Starting Qwen Daemon on {args.host}:{args.port}")
+    # A single worker is required: the model, generation lock and queue
+    # state live in this process.
+    uvicorn.run(app, host=args.host, port=args.port, loop=args.loop, http=args.http)
 
 
 if __name__ == "__main__":
@@ -191,8 +191,9 @@ class SessionStore:
     def save(self, session: Session) -> None:
         """Save a session to disk."""
         path = self._session_path(session.id)
-        # Write atomically via temp file
-        temp_path = path.with_suffix(".tmp")
+        # Write atomically via a per-call temp file; saves may run concurrently
+        # in worker threads
+        temp_path = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
         try:
             with open(temp_path, "w", encoding="utf-8") as f:
                 json.dump(session.to_dict(), f, indent=2)
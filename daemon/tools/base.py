@@ -12,15 +12,141 @@ This architecture enables:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import inspect
+import json
+import math
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Callable, Coroutine, Protocol, runtime_checkable
 
 
 # Type alias for tool functions (sync or async)
 ToolFunction = Callable[..., str | Coroutine[Any, Any, str]]
 
+# Shared parameter schemas and fragments reused across tools (do not mutate)
+EMPTY_PARAMETERS: dict[str, Any] = {"type": "object", "properties": {}}
+PAGE_PARAM: dict[str, Any] = {
+    "type": "integer",
+    "description": "Page number for pagination (0-indexed)",
+}
+SINCE_DAYS_PARAM: dict[str, Any] = {
+    "type": "integer",
+    "description": "How many days back to look (default 7, no limit)",
+}
+PAGE_LIMIT_PARAM: dict[str, Any] = {
+    "type": "integer",
+    "description": "Max results per page (default 10)",
+}
+ACCOUNT_PARAM: dict[str, Any] = {
+    "type": "string",
+    "description": "Account name to search (e.g., 'ep', 'jm'). If not specified, searches all accounts.",
+}
+MAX_RESULTS_PARAM: dict[str, Any] = {
+    "type": "integer",
+    "description": "Maximum number of results (default: 20)",
+}
 
-@dataclass(frozen=True)
+# Returned by a coercer when a value can't represent its declared type
+_INVALID: Any = object()
+
+
+def _as_integer(value: Any) -> Any:
+    """Value as an int when lossless (5, 5.0, "5", "5.0"), else _INVALID."""
+    if type(value) is int:
+        return value
+    if type(value) is str:
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                value = float(value)
+            except ValueError:
+                return _INVALID
+    # bool is an int subclass but never a valid integer, so match exact types
+    if type(value) is float and value.is_integer():
+        return int(value)
+    return _INVALID
+
+
+def _as_number(value: Any) -> Any:
+    """Value as an int/float, parsing finite numeric strings, else _INVALID."""
+    if type(value) is int or type(value) is float:
+        return value
+    if type(value) is str:
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                number = float(value)
+            except ValueError:
+                return _INVALID
+            return number if math.isfinite(number) else _INVALID
+    return _INVALID
+
+
+def _is_instance(expected: type) -> Callable[[Any], Any]:
+    return lambda value: value if isinstance(value, expected) else _INVALID
+
+
+# JSON Schema primitive types -> coercers for values from the JSON parser.
+# Models often quote numbers or emit 5.0 for integers; those are converted
+# losslessly rather than rejected.
+_JSON_TYPES: dict[str, Callable[[Any], Any]] = {
+    "string": _is_instance(str),
+    "integer": _as_integer,
+    "number": _as_number,
+    "boolean": _is_instance(bool),
+    "array": _is_instance(list),
+    "object": _is_instance(dict),
+}
+
+# Coerces tool-call arguments; returns the (possibly converted) arguments
+# and an error message or None
+ArgumentValidator = Callable[[dict[str, Any]], tuple[dict[str, Any], str | None]]
+
+
+def _compile_validator(parameters: dict[str, Any]) -> ArgumentValidator:
+    """
+    Specialize an argument validator for one parameter schema.
+
+    The schema is walked once here; the returned function only checks the
+    precomputed required names and (name, coercer) pairs. Null values are
+    treated as omitted optional arguments. Converted values go into a copy,
+    so the caller's arguments are never mutated.
+    """
+    required: tuple[str, ...] = tuple(parameters.get("required", ()))
+    typed: tuple[tuple[str, Callable[[Any], Any], str], ...] = tuple(
+        (name, _JSON_TYPES[prop["type"]], prop["type"])
+        for name, prop in parameters.get("properties", {}).items()
+        if prop.get("type") in _JSON_TYPES
+    )
+
+    def validate(arguments: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+        if not isinstance(arguments, dict):
+            return arguments, "Arguments must be a JSON object"
+        for name in required:
+            if name not in arguments:
+                return arguments, f"Missing required argument: {name}"
+        coerced: dict[str, Any] | None = None
+        for name, coerce, type_name in typed:
+            value = arguments.get(name)
+            if value is None:
+                continue
+            converted = coerce(value)
+            if converted is _INVALID:
+                return arguments, f"Argument {name} must be of type {type_name}"
+            if converted is not value:
+                if coerced is None:
+                    coerced = dict(arguments)
+                coerced[name] = converted
+        return (arguments if coerced is None else coerced), None
+
+    return validate
+
+
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
     """
     Immutable tool specification (schema only).
@@ -30,17 +156,63 @@ class ToolSpec:
     name: str
     description: str
     parameters: dict[str, Any]
+    _schema: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    _schema_json: str = field(init=False, repr=False, compare=False)
+    _validator: ArgumentValidator = field(init=False, repr=False, compare=False)
+    _compact: str = field(init=False, repr=False, compare=False)
 
-    def to_schema(self) -> dict[str, Any]:
-        """Convert to JSON Schema format for LLM prompt injection."""
-        return {
+    def __post_init__(self) -> None:
+        # Names are registry and profile lookup keys; interned keys let dict
+        # lookups match on identity
+        object.__setattr__(self, "name", sys.intern(self.name))
+        # Specs are immutable, so the prompt schema is built exactly once
+        schema = {
             "name": self.name,
             "description": self.description,
             "parameters": self.parameters,
         }
+        object.__setattr__(self, "_schema", MappingProxyType(schema))
+        # json.dumps, not orjson: this text is model input and must keep the
+        # spaced, ASCII-escaped form the prompts were written against
+        object.__setattr__(self, "_schema_json", json.dumps(schema))
+        object.__setattr__(self, "_validator", _compile_validator(self.parameters))
+        required = set(self.parameters.get("required", ()))
+        params = ", ".join(
+            f"{pname}{'*' if pname in required else ''}:{pdef.get('type', 'any')}"
+            for pname, pdef in self.parameters.get("properties", {}).items()
+        )
+        object.__setattr__(
+            self, "_compact", f"{self.name}({params}): {self.description}"
+        )
+
+    def to_schema(self) -> Mapping[str, Any]:
+        """
+        Convert to JSON Schema format for LLM prompt injection.
+
+        Returns a shared, precomputed read-only view.
+        """
+        return self._schema
 
+    def to_schema_json(self) -> str:
+        """Schema pre-serialized as JSON, ready to splice into a prompt."""
+        return self._schema_json
 
-@dataclass(frozen=True)
+    def to_compact(self) -> str:
+        """One-line signature, e.g. `search(query*:string, limit:integer): ...`."""
+        return self._compact
+
+    def validate_arguments(self, arguments: dict[str, Any]) -> str | None:
+        """Check tool-call arguments against the schema; return an error or None."""
+        return self._validator(arguments)[1]
+
+    def prepare_arguments(
+        self, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any], str | None]:
+        """Coerce and check arguments; return them with an error or None."""
+        return self._validator(arguments)
+
+
+@dataclass(frozen=True, slots=True)
 class Tool:
     """
     Complete tool definition: schema + implementation.
@@ -52,6 +224,13 @@ class Tool:
     """
     spec: ToolSpec
     execute: ToolFunction
+    # Resolved once so execution doesn't introspect the function per call
+    is_async: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "is_async", inspect.iscoroutinefunction(self.execute)
+        )
 
     @property
     def name(self) -> str:
@@ -65,9 +244,12 @@ class Tool:
     def parameters(self) -> dict[str, Any]:
         return self.spec.parameters
 
-    def to_schema(self) -> dict[str, Any]:
+    def to_schema(self) -> Mapping[str, Any]:
         return self.spec.to_schema()
 
+    def to_schema_json(self) -> str:
+        return self.spec.to_schema_json()
+
 
 @runtime_checkable
 class ToolModule(Protocol):
@@ -10,7 +10,7 @@ from typing import Any
 
 from playwright.async_api import Error as PlaywrightError
 
-from ..base import tool
+from ..base import EMPTY_PARAMETERS, tool
 from .manager import get_browser_manager
 
 logger = logging.getLogger("qwen.browser")
@@ -19,7 +19,7 @@ logger = logging.getLogger("qwen.browser")
 @tool(
     name="browser_analyze_page",
     description="Analyze the current page to check if it has a code editor and run button. Returns structured info about whether the page is READY for code input. ALWAYS call this after navigating to a new page!",
-    parameters={"type": "object", "properties": {}},
+    parameters=EMPTY_PARAMETERS,
 )
 async def browser_analyze_page() -> str:
     """Analyze the current page for code editor and run button."""
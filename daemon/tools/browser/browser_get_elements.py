@@ -12,7 +12,7 @@ from playwright.async_api import (
     Error as PlaywrightError,
 )
 
-from ..base import tool
+from ..base import EMPTY_PARAMETERS, tool
 from .manager import get_browser_manager
 
 logger = logging.getLogger("qwen.browser")
@@ -21,7 +21,7 @@ logger = logging.getLogger("qwen.browser")
 @tool(
     name="browser_get_elements",
     description="List clickable elements (buttons, links) on the page. Useful to find the Run button.",
-    parameters={"type": "object", "properties": {}},
+    parameters=EMPTY_PARAMETERS,
 )
 async def browser_get_elements() -> str:
     """List interactive elements on page."""
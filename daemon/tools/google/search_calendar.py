@@ -14,7 +14,7 @@ from typing import Any
 
 from daemon.sync.storage import load_all_events, resolve_account
 
-from ..base import tool
+from ..base import ACCOUNT_PARAM, MAX_RESULTS_PARAM, tool
 
 logger = logging.getLogger("qwen.tools.google")
 
@@ -128,10 +128,7 @@ Use this to find events by title, description, date range, or attendees.""",
     parameters={
         "type": "object",
         "properties": {
-            "account": {
-                "type": "string",
-                "description": "Account name to search (e.g., 'ep', 'jm'). If not specified, searches all accounts.",
-            },
+            "account": ACCOUNT_PARAM,
             "query": {
                 "type": "string",
                 "description": "Search in event title, description, and location",
@@ -152,12 +149,8 @@ Use this to find events by title, description, date range, or attendees.""",
                 "type": "string",
                 "description": "Filter by attendee email or name (partial match)",
             },
-            "limit": {
-                "type": "integer",
-                "description": "Maximum number of results (default: 20)",
-            },
+            "limit": MAX_RESULTS_PARAM,
         },
-        "required": [],
     },
 )
 def search_calendar(
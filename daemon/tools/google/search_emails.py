@@ -14,7 +14,7 @@ from typing import Any
 
 from daemon.sync.storage import load_all_emails, resolve_account
 
-from ..base import tool
+from ..base import ACCOUNT_PARAM, MAX_RESULTS_PARAM, tool
 
 logger = logging.getLogger("qwen.tools.google")
 
@@ -127,10 +127,7 @@ Use this to find emails by sender, recipient, subject, content, or date range.""
     parameters={
         "type": "object",
         "properties": {
-            "account": {
-                "type": "string",
-                "description": "Account name to search (e.g., 'ep', 'jm'). If not specified, searches all accounts.",
-            },
+            "account": ACCOUNT_PARAM,
             "from_email": {
                 "type": "string",
                 "description": "Filter by sender email or name (partial match)",
@@ -159,12 +156,8 @@ Use this to find emails by sender, recipient, subject, content, or date range.""
                 "type": "boolean",
                 "description": "Filter by attachment presence",
             },
-            "limit": {
-                "type": "integer",
-                "description": "Maximum number of results (default: 20)",
-            },
+            "limit": MAX_RESULTS_PARAM,
         },
-        "required": [],
     },
 )
 def search_emails(
@@ -7,17 +7,13 @@ Use this to orient in time before answering questions about time periods.
 import json
 from datetime import datetime, timedelta, timezone
 
-from ..base import tool
+from ..base import EMPTY_PARAMETERS, tool
 
 
 @tool(
     name="get_current_datetime",
     description="Get the current date and time. ALWAYS call this first when answering questions about time periods like 'last week', 'this month', 'past 2 months', 'recently', etc. Returns UTC and local time with helpful date range hints.",
-    parameters={
-        "type": "object",
-        "properties": {},
-        "required": [],
-    },
+    parameters=EMPTY_PARAMETERS,
 )
 def get_current_datetime() -> str:
     """Get the current date and time with helpful hints."""
@@ -7,7 +7,7 @@ List recent Linear activity: state changes, assignments, comments, etc.
 import json
 from datetime import datetime, timedelta, timezone
 
-from ..base import tool
+from ..base import PAGE_PARAM, SINCE_DAYS_PARAM, tool
 from .data_store import get_data_store
 
 
@@ -17,10 +17,7 @@ from .data_store import get_data_store
     parameters={
         "type": "object",
         "properties": {
-            "since_days": {
-                "type": "integer",
-                "description": "How many days back to look (default 7, no limit)",
-            },
+            "since_days": SINCE_DAYS_PARAM,
             "event_type": {
                 "type": "string",
                 "description": "Filter by event type (e.g., 'state', 'assignee', 'comment')",
@@ -33,12 +30,8 @@ from .data_store import get_data_store
                 "type": "integer",
                 "description": "Max results per page (default 20)",
             },
-            "page": {
-                "type": "integer",
-                "description": "Page number for pagination (0-indexed)",
-            },
+            "page": PAGE_PARAM,
         },
-        "required": [],
     },
 )
 def list_linear_events(
@@ -7,7 +7,7 @@ List active Slack threads sorted by recent activity.
 import json
 from datetime import datetime, timedelta, timezone
 
-from ..base import tool
+from ..base import PAGE_PARAM, SINCE_DAYS_PARAM, tool
 from .data_store import get_data_store
 
 
@@ -17,10 +17,7 @@ from .data_store import get_data_store
     parameters={
         "type": "object",
         "properties": {
-            "since_days": {
-                "type": "integer",
-                "description": "How many days back to look (default 7, no limit)",
-            },
+            "since_days": SINCE_DAYS_PARAM,
             "channel": {
                 "type": "string",
                 "description": "Optional channel ID to limit to a specific channel",
@@ -29,12 +26,8 @@ from .data_store import get_data_store
                 "type": "integer",
                 "description": "Max threads per page (default 15)",
             },
-            "page": {
-                "type": "integer",
-                "description": "Page number for pagination (0-indexed)",
-            },
+            "page": PAGE_PARAM,
         },
-        "required": [],
     },
 )
 def list_recent_slack_activity(
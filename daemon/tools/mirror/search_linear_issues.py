@@ -6,7 +6,7 @@ Search Linear issues with optional filters for state, assignee, and label.
 
 import json
 
-from ..base import tool
+from ..base import PAGE_LIMIT_PARAM, PAGE_PARAM, tool
 from .data_store import get_data_store
 
 
@@ -32,16 +32,9 @@ from .data_store import get_data_store
                 "type": "string",
                 "description": "Filter by label name (partial match)",
             },
-            "limit": {
-                "type": "integer",
-                "description": "Max results per page (default 10)",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number for pagination (0-indexed)",
-            },
+            "limit": PAGE_LIMIT_PARAM,
+            "page": PAGE_PARAM,
         },
-        "required": [],
     },
 )
 def search_linear_issues(
@@ -6,7 +6,7 @@ Search Slack messages across all channels and threads.
 
 import json
 
-from ..base import tool
+from ..base import PAGE_LIMIT_PARAM, PAGE_PARAM, tool
 from .data_store import get_data_store
 
 
@@ -24,14 +24,8 @@ from .data_store import get_data_store
                 "type": "string",
                 "description": "Optional channel ID to limit search (e.g., C08D0GTKWLD)",
             },
-            "limit": {
-                "type": "integer",
-                "description": "Max results per page (default 10)",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number for pagination (0-indexed)",
-            },
+            "limit": PAGE_LIMIT_PARAM,
+            "page": PAGE_PARAM,
         },
         "required": ["query"],
     },
@@ -36,9 +36,6 @@ if TYPE_CHECKING:
             self, requests: list[Any], error: Any
         ) -> tuple[bool, Any]: ...
 
-from Cocoa import NSURL
-import Vision
-
 from ..base import tool
 
 logger = logging.getLogger("qwen.ocr")
@@ -83,6 +80,10 @@ def _ocr_image(image_path: Path) -> str:
     """
     Perform OCR on a single image using macOS Vision framework.
     """
+    # pyobjc frameworks are slow to import; load them on first OCR only
+    from Cocoa import NSURL
+    import Vision
+
     logger.info(f"OCR processing: {image_path}")
 
     # Create image URL
@@ -14,7 +14,7 @@ import asyncio
 import inspect
 import json
 import logging
-from typing import Any
+from typing import Any, Coroutine, cast
 
 from .base import Tool, ToolSpec, ToolFunction
 
@@ -37,10 +37,17 @@ class ToolRegistry:
         self._lazy_loaders: dict[str, tuple[str, str]] = (
             {}
         )  # name -> (module_path, attr)
+        self._version: int = 0
+        self._names: frozenset[str] | None = None  # cached until next registration
+
+    def _invalidate(self) -> None:
+        self._version += 1
+        self._names = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool directly."""
         self._tools[tool.name] = tool
+        self._invalidate()
         logger.debug(f"Registered tool: {tool.name}")
 
     def register_lazy(self, name: str, module_path: str, attr: str = "TOOL") -> None:
@@ -50,6 +57,7 @@ class ToolRegistry:
         The tool module will be imported and the attr accessed on first use.
         """
         self._lazy_loaders[name] = (module_path, attr)
+        self._invalidate()
         logger.debug(f"Registered lazy tool: {name} -> {module_path}.{attr}")
 
     def _load_lazy(self, name: str) -> Tool | None:
@@ -98,6 +106,9 @@ class ToolRegistry:
         tool = self.get(name)
         if tool is None:
             return json.dumps({"error": f"Unknown tool: {name}"})
+        arguments, error = tool.spec.prepare_arguments(arguments)
+        if error is not None:
+            return json.dumps({"error": error})
 
         try:
             result = tool.execute(**arguments)
@@ -125,28 +136,48 @@ class ToolRegistry:
         tool = self.get(name)
         if tool is None:
             return json.dumps({"error": f"Unknown tool: {name}"})
+        arguments, error = tool.spec.prepare_arguments(arguments)
+        if error is not None:
+            return json.dumps({"error": error})
 
         try:
-            if asyncio.iscoroutinefunction(tool.execute):
+            if tool.is_async:
                 # Async tool - await directly
-                result: str = await tool.execute(**arguments)
+                coro = cast(Coroutine[Any, Any, str], tool.execute(**arguments))
+                result = await coro
             else:
                 # Sync tool - run in thread pool to avoid blocking event loop
-                result = await asyncio.to_thread(tool.execute, **arguments)
+                result = cast(str, await asyncio.to_thread(tool.execute, **arguments))
             return result
         except Exception as e:
             logger.exception(f"Tool {name} async execution failed")
             return json.dumps({"error": f"Tool execution failed: {str(e)}"})
 
+    def __contains__(self, name: object) -> bool:
+        """Whether a tool is registered (including lazy), without loading it."""
+        return name in self._tools or name in self._lazy_loaders
+
+    @property
+    def version(self) -> int:
+        """Registration counter; changes whenever a tool is (lazily) registered."""
+        return self._version
+
+    @property
+    def tool_names(self) -> frozenset[str]:
+        """All registered tool names (including lazy), cached between registrations."""
+        if self._names is None:
+            self._names = frozenset(self._tools) | frozenset(self._lazy_loaders)
+        return self._names
+
     @property
     def available_tools(self) -> list[str]:
         """List all registered tool names (including lazy)."""
-        return list(set(self._tools.keys()) | set(self._lazy_loaders.keys()))
+        return list(self.tool_names)
 
     def get_all_specs(self) -> dict[str, ToolSpec]:
         """Get specs for all registered tools."""
         specs = {}
-        for name in self.available_tools:
+        for name in self.tool_names:
             spec = self.get_spec(name)
             if spec:
                 specs[name] = spec
@@ -0,0 +1,96 @@
+# pyright: reportPrivateUsage=false
+"""
+Tests for chat service helpers.
+
+Covers the pure prompt/response helpers in daemon.chat; no model is loaded.
+
+Run with: pytest tests/test_chat.py -v
+"""
+
+from __future__ import annotations
+
+from daemon.chat import (
+    ToolCall,
+    _clean_response,
+    extract_final_response,
+    extract_thinking,
+    parse_tool_calls,
+)
+
+
+class TestParseToolCalls:
+    """Tests for tool-call extraction from model output."""
+
+    def test_no_tool_calls(self) -> None:
+        """Plain text yields no calls."""
+        assert parse_tool_calls("Just an answer.") == []
+
+    def test_multiple_tool_calls_in_order(self) -> None:
+        """Every well-formed block is returned, in response order."""
+        response = (
+            '<tool_call>\n{"name": "a", "arguments": {"x": 1}}\n</tool_call>\n'
+            '<tool_call>{"name": "b", "arguments": {}}</tool_call>'
+        )
+        assert parse_tool_calls(response) == [
+            ToolCall(name="a", arguments={"x": 1}),
+            ToolCall(name="b", arguments={}),
+        ]
+
+    def test_malformed_json_is_skipped(self) -> None:
+        """Blocks with invalid JSON are ignored rather than raising."""
+        response = (
+            "<tool_call>{not json}</tool_call>"
+            '<tool_call>{"name": "ok"}</tool_call>'
+        )
+        assert parse_tool_calls(response) == [ToolCall(name="ok", arguments={})]
+
+    def test_slotted_messages_have_no_dict(self) -> None:
+        """Message types are slotted to avoid per-instance __dict__."""
+        assert not hasattr(ToolCall(name="a", arguments={}), "__dict__")
+
+
+class TestExtractFinalResponse:
+    """Tests for stripping model artifacts from the final answer."""
+
+    def test_strips_tool_calls_and_thinking(self) -> None:
+        """Tool-call and think blocks are removed, surrounding text kept."""
+        response = (
+            "<think>\nplan\n</think>\nHello"
+            '<tool_call>{"name": "a"}</tool_call> world'
+        )
+        assert extract_final_response(response) == "Hello world"
+
+    def test_plain_text_is_stripped(self) -> None:
+        """Text without artifacts is only whitespace-trimmed."""
+        assert extract_final_response("  answer \n") == "answer"
+
+
+class TestExtractThinking:
+    """Tests for pulling the first <think> block out of a response."""
+
+    def test_returns_stripped_first_block(self) -> None:
+        """Content of the first complete block is returned, trimmed."""
+        response = "<think>\n first \n</think>answer<think>second</think>"
+        assert extract_thinking(response) == "first"
+
+    def test_missing_or_unclosed_block(self) -> None:
+        """No block, or an unclosed one, yields None."""
+        assert extract_thinking("answer") is None
+        assert extract_thinking("<think>still going") is None
+
+
+class TestCleanResponse:
+    """Tests for the thinking flag used by the think-without-acting nudge."""
+
+    def test_unclosed_think_counts_as_thinking(self) -> None:
+        """A thought cut off at max_tokens is still reported as thinking."""
+        assert _clean_response("<think>ran out of tok") == ("<think>ran out of tok", True)
+
+    def test_think_inside_tool_call_counts(self) -> None:
+        """Thinking is detected on the raw response, before blocks are stripped."""
+        response = '<tool_call>{"name": "a"} <think>x</think></tool_call>'
+        assert _clean_response(response) == ("", True)
+
+    def test_no_thinking(self) -> None:
+        """Plain answers are not flagged."""
+        assert _clean_response("answer") == ("answer", False)
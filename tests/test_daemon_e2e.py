@@ -31,7 +31,7 @@ import pytest
 DAEMON_HOST = "127.0.0.1"
 DAEMON_PORT = 15997  # Use non-standard port to avoid conflicts
 DAEMON_URL = f"http://{DAEMON_HOST}:{DAEMON_PORT}"
-STARTUP_TIMEOUT = 30  # seconds to wait for daemon to start
+STARTUP_TIMEOUT = 300  # seconds to wait for daemon to start (loads model weights)
 REQUEST_TIMEOUT = 120  # seconds for individual requests (model loading can be slow)
 
 
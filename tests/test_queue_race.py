@@ -37,7 +37,7 @@ import pytest
 DAEMON_HOST = "127.0.0.1"
 DAEMON_PORT = 15998  # Use different port from other tests
 DAEMON_URL = f"http://{DAEMON_HOST}:{DAEMON_PORT}"
-STARTUP_TIMEOUT = 60  # seconds to wait for daemon to start
+STARTUP_TIMEOUT = 300  # seconds to wait for daemon to start (loads model weights)
 REQUEST_TIMEOUT = 300  # seconds for requests (model loading + generation)
 
 
@@ -0,0 +1,91 @@
+# pyright: reportPrivateUsage=false
+"""
+Tests for server helpers.
+
+Covers pure helpers in daemon.server; no model is loaded and no daemon is
+started.
+
+Run with: pytest tests/test_server.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+import daemon.server as server
+from daemon.chat import ModelSize
+from daemon.server import _LARGE_TOOL_RESULT, AppState, _parse_tool_result
+
+
+class TestParseToolResult:
+    """Tests for decoding tool results returned by the invoke endpoints."""
+
+    def test_json_object(self) -> None:
+        """Valid JSON is decoded."""
+        assert asyncio.run(_parse_tool_result('{"a": [1, 2]}')) == {"a": [1, 2]}
+
+    def test_non_json_is_returned_raw(self) -> None:
+        """Plain text results come back unchanged."""
+        assert asyncio.run(_parse_tool_result("not json")) == "not json"
+
+    def test_nan_payload_is_decoded(self) -> None:
+        """NaN/Infinity from json.dumps still decode, as with stdlib json."""
+        result = asyncio.run(_parse_tool_result('{"mean": NaN, "max": Infinity}'))
+        assert math.isnan(result["mean"])
+        assert result["max"] == math.inf
+
+    def test_large_nan_payload_is_decoded(self) -> None:
+        """The off-loop path for large results uses the same fallback."""
+        payload = '{"pad": "' + "x" * _LARGE_TOOL_RESULT + '", "v": NaN}'
+        result = asyncio.run(_parse_tool_result(payload))
+        assert math.isnan(result["v"])
+
+
+class FakeChatService:
+    """Stands in for ChatService; records loads instead of loading weights."""
+
+    def __init__(self, model_size: ModelSize) -> None:
+        self.model_size = model_size
+        self.is_loaded = False
+
+    async def load_async(self) -> None:
+        self.is_loaded = True
+
+
+class TestLoadChatService:
+    """Tests for resident model bookkeeping in AppState."""
+
+    @pytest.fixture(autouse=True)
+    def fake_services(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(server, "create_chat_service", FakeChatService)
+
+    def test_state_unchanged_until_loaded(self) -> None:
+        """A fresh AppState reports nothing loaded."""
+        state = AppState()
+        assert not state.model_loaded
+        assert state.current_model_size is None
+
+    def test_load_sets_current_model(self) -> None:
+        """Loading makes the service resident and reports its size."""
+        state = AppState()
+        service = asyncio.run(state.load_chat_service(ModelSize.SMALL))
+        assert service.is_loaded
+        assert state.model_loaded
+        assert state.current_model_size is ModelSize.SMALL
+
+    def test_switching_size_evicts_previous(self) -> None:
+        """Only one service stays resident; the same size is reused."""
+        state = AppState()
+
+        async def run() -> None:
+            small = await state.load_chat_service(ModelSize.SMALL)
+            large = await state.load_chat_service(ModelSize.LARGE)
+            assert large is not small
+            assert await state.load_chat_service(ModelSize.LARGE) is large
+            assert await state.load_chat_service(ModelSize.SMALL) is not small
+
+        asyncio.run(run())
+        assert state.current_model_size is ModelSize.SMALL
@@ -0,0 +1,118 @@
+"""
+Tests for tool base types.
+
+Covers ToolSpec argument validation and rendering; no tool modules are loaded.
+
+Run with: pytest tests/test_tool_base.py -v
+"""
+
+from __future__ import annotations
+
+from daemon.tools.base import ToolSpec
+
+
+SPEC = ToolSpec(
+    name="search",
+    description="Search things",
+    parameters={
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Search term"},
+            "limit": {"type": "integer", "description": "Max results"},
+            "exact": {"type": "boolean", "description": "Exact match"},
+        },
+        "required": ["query"],
+    },
+)
+
+
+class TestValidateArguments:
+    """Tests for the validator compiled from a spec's parameter schema."""
+
+    def test_valid_arguments(self) -> None:
+        """Required present and typed optionals pass."""
+        assert SPEC.validate_arguments({"query": "x", "limit": 5, "exact": True}) is None
+
+    def test_missing_required(self) -> None:
+        """A missing required argument is reported by name."""
+        assert SPEC.validate_arguments({"limit": 5}) == "Missing required argument: query"
+
+    def test_wrong_type(self) -> None:
+        """Mistyped arguments are rejected, including bools for integers."""
+        assert SPEC.validate_arguments({"query": "x", "limit": "five"}) is not None
+        assert SPEC.validate_arguments({"query": "x", "limit": True}) is not None
+        assert SPEC.validate_arguments({"query": 5}) is not None
+
+    def test_lossy_numbers_rejected(self) -> None:
+        """Fractional or non-finite values never become integers."""
+        for limit in (5.5, "5.5", "inf", "nan"):
+            assert SPEC.validate_arguments({"query": "x", "limit": limit}) == (
+                "Argument limit must be of type integer"
+            )
+
+    def test_lossless_numbers_coerced(self) -> None:
+        """Quoted and integral-float integers are converted, not rejected."""
+        for limit in ("5", 5.0, "5.0", " 5 "):
+            arguments = {"query": "x", "limit": limit}
+            prepared, error = SPEC.prepare_arguments(arguments)
+            assert error is None
+            assert prepared == {"query": "x", "limit": 5}
+            assert type(prepared["limit"]) is int
+            assert arguments["limit"] == limit  # caller's dict is not mutated
+
+    def test_number_strings_coerced(self) -> None:
+        """Finite numeric strings become numbers; others are rejected."""
+        spec = ToolSpec(
+            name="scale",
+            description="Scale",
+            parameters={"type": "object", "properties": {"factor": {"type": "number"}}},
+        )
+        assert spec.prepare_arguments({"factor": "1.5"}) == ({"factor": 1.5}, None)
+        assert spec.validate_arguments({"factor": "inf"}) is not None
+        assert spec.validate_arguments({"factor": False}) is not None
+
+    def test_valid_arguments_pass_through(self) -> None:
+        """Arguments needing no conversion are returned as the same object."""
+        arguments = {"query": "x", "limit": 5}
+        assert SPEC.prepare_arguments(arguments) == (arguments, None)
+        assert SPEC.prepare_arguments(arguments)[0] is arguments
+
+    def test_null_optional_and_non_object(self) -> None:
+        """Null optionals are allowed; non-object arguments are rejected."""
+        assert SPEC.validate_arguments({"query": "x", "limit": None}) is None
+        assert SPEC.validate_arguments("query") is not None  # type: ignore[arg-type]
+
+
+class TestToCompact:
+    """Tests for the compact one-line signature rendering."""
+
+    def test_signature_marks_required(self) -> None:
+        """Parameters keep schema order; required ones get a * marker."""
+        assert SPEC.to_compact() == (
+            "search(query*:string, limit:integer, exact:boolean): Search things"
+        )
+
+    def test_no_parameters(self) -> None:
+        """Tools without parameters render an empty argument list."""
+        spec = ToolSpec(
+            name="now",
+            description="Current time",
+            parameters={"type": "object", "properties": {}},
+        )
+        assert spec.to_compact() == "now(): Current time"
+
+
+class TestToSchemaJson:
+    """Tests for the pre-serialized prompt schema."""
+
+    def test_matches_json_dumps(self) -> None:
+        """Prompt text keeps json.dumps spacing and ASCII escaping."""
+        spec = ToolSpec(
+            name="greet",
+            description="Say héllo",
+            parameters={"type": "object", "properties": {}},
+        )
+        assert spec.to_schema_json() == (
+            '{"name": "greet", "description": "Say h\\u00e9llo", '
+            '"parameters": {"type": "object", "properties": {}}}'
+        )